@@ -2,7 +2,6 @@ from uuid import uuid4
 from typing import Dict, List, Any, Union, Optional
 from .types import Backends, BroadcastSignalsCaller, NodeCaller, EventTypes, WorkflowValidationError
 from .lib.register_event import register_event
-from .lib.yaml_parser import parse_yaml
 from .lib.operational import add_operational_state
 from .lib.parent_sync import get_signals_for_parent
 from .lib.inheritance import (
@@ -82,8 +81,7 @@ def orchestrate(
         parsed_registry = inherit_config(inherit_config_from_id, id, backends)
 
     if config:
-        validate_config(config)
-        parsed_config = parse_yaml(config)
+        parsed_config = validate_config(config)
         parsed_registry = extract_and_save_config_sections(parsed_config, id, backends)
 
     register_event(
@@ -37,14 +37,15 @@ def create_soe_get_context_tool(backends, execution_id: str, tools_registry=None
         """
         context = backends.context.get_context(execution_id)
 
-        # Filter out operational data
-        filtered = {k: v for k, v in context.items() if not k.startswith("__")}
+        def read(name: str) -> Any:
+            # Operational data is never exposed
+            return None if name.startswith("__") else context.get(name)
 
         if field:
-            return {field: filtered.get(field)}
+            return {field: read(field)}
         elif fields:
-            return {f: filtered.get(f) for f in fields}
+            return {f: read(f) for f in fields}
         else:
-            return filtered
+            return {k: v for k, v in context.items() if not k.startswith("__")}
 
     return get_context
@@ -0,0 +1,55 @@
+"""
+Memoization for config validators.
+
+Validation is a pure function of the config, but the same configs are
+validated repeatedly: fan-out children orchestrate the parent's registry,
+and node validators run again when the node executes, since injected
+nodes reach the registry without passing through validate_config. Configs
+that already passed are remembered so repeat validations skip the checks.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict
+
+
+VALIDATED_CONFIG_CACHE_SIZE = 256
+
+ConfigValidator = Callable[[Dict[str, Any]], None]
+
+
+def _config_key(config: Dict[str, Any]) -> bytes:
+    """Fixed-size content key for a config."""
+    data = repr(config).encode("utf-8", "backslashreplace")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def remember_valid_configs(validator: ConfigValidator) -> ConfigValidator:
+    """
+    Wrap a config validator so each distinct config is checked once.
+
+    The registry is reloaded for every broadcast, so configs are keyed on
+    their content rather than their identity. Only configs that pass are
+    remembered; invalid ones raise every time.
+    """
+    validated: "OrderedDict[bytes, None]" = OrderedDict()
+    lock = threading.Lock()
+
+    @wraps(validator)
+    def validate(config: Dict[str, Any]) -> None:
+        key = _config_key(config)
+        with lock:
+            if key in validated:
+                validated.move_to_end(key)
+                return
+
+        validator(config)
+
+        with lock:
+            validated[key] = None
+            if len(validated) > VALIDATED_CONFIG_CACHE_SIZE:
+                validated.popitem(last=False)
+
+    return validate
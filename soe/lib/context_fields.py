@@ -5,7 +5,8 @@ Fields are stored as lists to maintain update history.
 Reading always returns the last (most recent) value.
 """
 
-from typing import Any, Dict, List
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List
 
 
 def set_field(context: Dict[str, Any], field: str, value: Any) -> None:
@@ -49,3 +50,32 @@ def get_accumulated(context: Dict[str, Any], field: str) -> List[Any]:
         return list(history[0])
 
     return list(history)
+
+
+class ContextView(Mapping):
+    """
+    Read-only view of a context with fields unwrapped to their latest value.
+
+    Fields are unwrapped on access, so rendering a template that touches a
+    few fields does not walk the whole context. Operational keys (``__``
+    prefix) are passed through as-is.
+    """
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: Dict[str, Any]):
+        self._context = context
+
+    def __getitem__(self, field: str) -> Any:
+        if field not in self._context:
+            raise KeyError(field)
+        return get_field(self._context, field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._context)
+
+    def __len__(self) -> int:
+        return len(self._context)
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._context
@@ -3,46 +3,106 @@ Jinja template rendering utilities for prompt processing.
 """
 
 import re
-from typing import Dict, Any, Set, List, Tuple
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 
-from jinja2 import Environment, BaseLoader, TemplateSyntaxError
+from jinja2 import Environment, BaseLoader, Template, TemplateSyntaxError
+from jinja2.exceptions import FilterArgumentError
 
-from .context_fields import get_field
+try:
+    from jinja2 import pass_context
+except ImportError:  # jinja2 < 3.0
+    from jinja2 import contextfilter as pass_context
 
+from .context_fields import ContextView, get_field
 
-def _create_accumulated_filter(full_context: Dict[str, Any]):
-    """Create an accumulated filter that returns full history for a field."""
-    def accumulated_filter(value):
-        """
-        Return the full accumulated history list for a context field.
 
-        Usage in templates:
-            {{ context.field | accumulated }}  - returns full list
-            {{ context.field | accumulated | length }}  - count of items
-            {{ context.field | accumulated | join(', ') }}  - join all items
+TEMPLATE_CACHE_SIZE = 256
+
+# Render variable carrying a HistoryIndex over the raw context for the
+# accumulated filter, so one Environment serves every render. Without it the
+# filter raises, as if it were not registered.
+HISTORY_INDEX_VAR = "_soe_history_index"
+
+
+class HistoryIndex:
+    """Finds the history list whose latest entry is a given value."""
+
+    __slots__ = ("_full_context", "_by_id")
+
+    def __init__(self, full_context: Dict[str, Any]):
+        self._full_context = full_context
+        self._by_id: Optional[Dict[int, list]] = None
 
-        If history has exactly one entry and it's a list, returns that list
-        (common case: initial context passed a list as value).
+    def find(self, value: Any) -> Optional[list]:
         """
-        # Find the field in full_context by matching the last value
-        for key, hist_list in full_context.items():
-            if key.startswith("__"):
-                continue
-            if isinstance(hist_list, list) and hist_list and hist_list[-1] == value:
-                # If history has exactly one entry and it's a list, return that list
-                if len(hist_list) == 1 and isinstance(hist_list[0], list):
-                    return hist_list[0]
+        Look the value up by identity, falling back to an equality scan.
+
+        Templates receive the latest entries themselves, so identity hits
+        are the common case; the index is built on first use.
+        """
+        if self._by_id is None:
+            self._by_id = {}
+            for hist_list in self._history_lists():
+                self._by_id.setdefault(id(hist_list[-1]), hist_list)
+
+        hist_list = self._by_id.get(id(value))
+        if hist_list is not None:
+            return hist_list
+
+        for hist_list in self._history_lists():
+            if hist_list[-1] == value:
                 return hist_list
-        # Fallback: return value as single-item list
-        return [value] if value is not None else []
+        return None
+
+    def _history_lists(self):
+        for key, hist_list in self._full_context.items():
+            if not key.startswith("__") and isinstance(hist_list, list) and hist_list:
+                yield hist_list
 
-    return accumulated_filter
 
+@pass_context
+def _accumulated_filter(jinja_context, value):
+    """
+    Return the full accumulated history list for a context field.
 
-def _extract_context_variables(template: str) -> Set[str]:
+    Usage in templates:
+        {{ context.field | accumulated }}  - returns full list
+        {{ context.field | accumulated | length }}  - count of items
+        {{ context.field | accumulated | join(', ') }}  - join all items
+
+    If history has exactly one entry and it's a list, returns that list
+    (common case: initial context passed a list as value).
+    """
+    history_index = jinja_context.get(HISTORY_INDEX_VAR)
+    if history_index is None:
+        raise FilterArgumentError("accumulated filter needs the full context")
+
+    hist_list = history_index.find(value)
+    if hist_list is not None:
+        # If history has exactly one entry and it's a list, return that list
+        if len(hist_list) == 1 and isinstance(hist_list[0], list):
+            return hist_list[0]
+        return hist_list
+    # Fallback: return value as single-item list
+    return [value] if value is not None else []
+
+
+_jinja_env = Environment(loader=BaseLoader())
+_jinja_env.filters["accumulated"] = _accumulated_filter
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(source: str) -> Template:
+    """Compile a template once; syntax errors are raised and not cached."""
+    return _jinja_env.from_string(source)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _extract_context_variables(template: str) -> FrozenSet[str]:
     """Extract variable names from a Jinja template."""
     if not template:
-        return set()
+        return frozenset()
 
     variables = set()
 
@@ -54,7 +114,7 @@ def _extract_context_variables(template: str) -> Set[str]:
     for match in re.finditer(bracket_pattern, template):
         variables.add(match.group(1))
 
-    return variables
+    return frozenset(variables)
 
 
 def get_context_for_prompt(
@@ -83,27 +143,42 @@ def get_context_for_prompt(
     return filtered_context, warnings
 
 
-def render_prompt(prompt: str, context: Dict[str, Any]) -> Tuple[str, List[str]]:
-    """Render a Jinja template prompt with the given context."""
+def get_render_variables(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Template variables for rendering against a context."""
+    return {"context": ContextView(context), HISTORY_INDEX_VAR: HistoryIndex(context)}
+
+
+def render_prompt(
+    prompt: str,
+    context: Dict[str, Any],
+    warnings: Optional[List[str]] = None,
+    render_variables: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, List[str]]:
+    """
+    Render a Jinja template prompt with the given context.
+
+    Callers that already ran get_context_for_prompt on the same prompt and
+    context can pass its warnings to skip collecting them again. Callers
+    rendering several templates against one context can share
+    get_render_variables(context) across them.
+    """
     if not prompt:
         return prompt, []
 
     if "{{" not in prompt and "{%" not in prompt:
         return prompt, []
 
-    _, warnings = get_context_for_prompt(context, prompt)
+    if warnings is None:
+        _, warnings = get_context_for_prompt(context, prompt)
+    else:
+        warnings = list(warnings)
 
-    unwrapped = {k: get_field(context, k) for k in context if not k.startswith("__")}
-    for k, v in context.items():
-        if k.startswith("__"):
-            unwrapped[k] = v
+    if render_variables is None:
+        render_variables = get_render_variables(context)
 
     try:
-        jinja_env = Environment(loader=BaseLoader())
-        # Register custom filters
-        jinja_env.filters["accumulated"] = _create_accumulated_filter(context)
-        template = jinja_env.from_string(prompt)
-        rendered = template.render(context=unwrapped)
+        template = compile_template(prompt)
+        rendered = template.render(**render_variables)
         return rendered, warnings
     except TemplateSyntaxError as e:
         warnings.append(f"Jinja syntax error: {e}")
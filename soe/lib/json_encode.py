@@ -0,0 +1,43 @@
+"""
+JSON encoding for text handed to LLMs.
+
+Uses orjson when it is installed and falls back to the stdlib encoder. Both
+paths produce the same text: non-ASCII characters are kept as-is, output
+is compact unless indentation (two spaces) is requested.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(
+    value: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serialize a value to a JSON string.
+
+    Args:
+        value: Value to serialize
+        indent: Indent nested structures by two spaces
+        default: Called for objects that are not JSON serializable
+
+    Raises:
+        TypeError: If the value cannot be serialized
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else None
+            return orjson.dumps(value, default=default, option=option).decode()
+        except TypeError:
+            # Non-str keys and the like; the stdlib encoder handles them
+            pass
+    if indent:
+        return json.dumps(value, indent=2, ensure_ascii=False, default=default)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=default)
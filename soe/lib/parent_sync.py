@@ -5,11 +5,15 @@ These functions check if a signal or context update should be propagated
 to the parent workflow based on the injected __parent__ metadata.
 """
 
+import threading
 from typing import Dict, Any, Tuple, Optional, List
 from ..types import Backends
 
 PARENT_INFO_KEY = "__parent__"
 
+# Concurrent fan-out children may update the same parent context
+_parent_sync_lock = threading.RLock()
+
 
 def get_signals_for_parent(
     signals: List[str], context: Dict[str, Any]
@@ -54,18 +58,24 @@ def sync_context_to_parent(
     - If parent doesn't have the key, copy the full list from child
     - If parent already has the key, extend with new items from child
     """
+    # Top-level executions, and children syncing nothing, skip the per-key checks
+    parent_info = context.get(PARENT_INFO_KEY)
+    if not parent_info or not parent_info.get("context_updates_to_parent"):
+        return
+
     for key in updated_keys:
         parent_id, should_sync = _check_parent_context_sync(key, context)
         if should_sync and parent_id:
-            parent_context = backends.context.get_context(parent_id)
-            child_history = context[key]
-
-            if key in parent_context:
-                # Append new items from child to parent's existing list
-                parent_context[key].extend(child_history)
-            else:
-                # Initialize parent with child's history
-                parent_context[key] = child_history
-
-            backends.context.save_context(parent_id, parent_context)
-            sync_context_to_parent(parent_context, [key], backends)
+            with _parent_sync_lock:
+                parent_context = backends.context.get_context(parent_id)
+                child_history = context[key]
+
+                if key in parent_context:
+                    # Append new items from child to parent's existing list
+                    parent_context[key].extend(child_history)
+                else:
+                    # Initialize parent with child's history
+                    parent_context[key] = child_history
+
+                backends.context.save_context(parent_id, parent_context)
+                sync_context_to_parent(parent_context, [key], backends)
@@ -6,15 +6,62 @@ Records events to telemetry backend and updates operational context state
 """
 
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ..types import Backends, EventTypes
 
 
+OPERATIONAL_EVENT_TYPES = frozenset({
+    EventTypes.SIGNALS_BROADCAST,
+    EventTypes.NODE_EXECUTION,
+    EventTypes.LLM_CALL,
+    EventTypes.NODE_ERROR,
+    EventTypes.TOOL_CALL,
+    EventTypes.AGENT_TOOL_CALL,
+})
+
+
+def _apply_operational_update(
+    operational: Dict[str, Any],
+    event_type: str,
+    data: Dict[str, Any],
+) -> None:
+    """Apply the operational state change for a single event in place."""
+    if event_type == EventTypes.SIGNALS_BROADCAST:
+        operational["signals"].extend(data.get("signals", []))
+
+    elif event_type == EventTypes.NODE_EXECUTION:
+        node_name = data.get("node_name")
+        if node_name:
+            nodes = operational["nodes"]
+            if node_name not in nodes:
+                nodes[node_name] = 0
+            nodes[node_name] += 1
+
+    elif event_type == EventTypes.LLM_CALL:
+        operational["llm_calls"] += 1
+
+    elif event_type == EventTypes.NODE_ERROR:
+        operational["errors"] += 1
+
+    elif event_type in (EventTypes.TOOL_CALL, EventTypes.AGENT_TOOL_CALL):
+        operational["tool_calls"] += 1
+
+
+def _changes_operational_state(event_type: str, data: Dict[str, Any]) -> bool:
+    """Check whether an event touches the operational state."""
+    if event_type not in OPERATIONAL_EVENT_TYPES:
+        return False
+    if event_type == EventTypes.NODE_EXECUTION:
+        return bool(data.get("node_name"))
+    return True
+
+
 def register_event(
     backends: Backends,
     execution_id: str,
     event_type: str,
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None,
+    context: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     Log telemetry and update operational state based on event type.
@@ -24,6 +71,9 @@ def register_event(
         execution_id: The execution ID
         event_type: Event type from EventTypes enum
         data: Event-specific data
+        context: Context the caller has loaded and is about to save. The
+            operational update is applied to it in place and saving is
+            left to the caller, instead of a separate read/write here.
     """
     data = data or {}
 
@@ -32,44 +82,68 @@ def register_event(
         backends.telemetry.log_event(
             execution_id,
             event_type,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=event_timestamp(),
             context=data
         )
 
     # Update operational state based on event type
-
-    if event_type == EventTypes.SIGNALS_BROADCAST:
+    if _changes_operational_state(event_type, data):
+        if context is not None:
+            _apply_operational_update(context["__operational__"], event_type, data)
+            return
         context = backends.context.get_context(execution_id)
-        operational = context["__operational__"]
-        signals = data.get("signals", [])
-        operational["signals"].extend(signals)
+        _apply_operational_update(context["__operational__"], event_type, data)
         backends.context.save_context(execution_id, context)
 
-    elif event_type == EventTypes.NODE_EXECUTION:
-        node_name = data.get("node_name")
-        if node_name:
-            context = backends.context.get_context(execution_id)
-            operational = context["__operational__"]
-            nodes = operational["nodes"]
-            if node_name not in nodes:
-                nodes[node_name] = 0
-            nodes[node_name] += 1
-            backends.context.save_context(execution_id, context)
 
-    elif event_type == EventTypes.LLM_CALL:
-        context = backends.context.get_context(execution_id)
-        operational = context["__operational__"]
-        operational["llm_calls"] += 1
-        backends.context.save_context(execution_id, context)
+def event_timestamp() -> str:
+    """Current UTC time in the format used for telemetry timestamps."""
+    return datetime.utcnow().isoformat() + "Z"
 
-    elif event_type == EventTypes.NODE_ERROR:
-        context = backends.context.get_context(execution_id)
-        operational = context["__operational__"]
-        operational["errors"] += 1
-        backends.context.save_context(execution_id, context)
 
-    elif event_type in (EventTypes.TOOL_CALL, EventTypes.AGENT_TOOL_CALL):
+def register_events(
+    backends: Backends,
+    execution_id: str,
+    events: List[Tuple[str, Dict[str, Any], str]],
+) -> None:
+    """
+    Register several previously recorded events at once.
+
+    Telemetry is written as a single batch when the backend implements
+    log_events_batch, and event by event otherwise. Operational state is
+    updated with one context read/write for the whole batch.
+
+    Args:
+        backends: Backend services
+        execution_id: The execution ID
+        events: List of (event_type, data, timestamp) tuples, in emission order,
+            each timestamp taken from event_timestamp() when the event occurred
+    """
+    if not events:
+        return
+
+    telemetry = backends.telemetry
+    if telemetry is not None:
+        log_events_batch = getattr(telemetry, "log_events_batch", None)
+        if log_events_batch is not None:
+            log_events_batch(
+                execution_id,
+                [
+                    {"event_type": event_type, "timestamp": timestamp, "context": data}
+                    for event_type, data, timestamp in events
+                ],
+            )
+        else:
+            for event_type, data, timestamp in events:
+                telemetry.log_event(execution_id, event_type, timestamp=timestamp, context=data)
+
+    operational_events = [
+        (event_type, data) for event_type, data, _ in events
+        if _changes_operational_state(event_type, data)
+    ]
+    if operational_events:
         context = backends.context.get_context(execution_id)
         operational = context["__operational__"]
-        operational["tool_calls"] += 1
+        for event_type, data in operational_events:
+            _apply_operational_update(operational, event_type, data)
         backends.context.save_context(execution_id, context)
@@ -5,11 +5,15 @@ Converts schema definitions to Pydantic models for runtime validation.
 Logic extracted from backends to centralize in lib.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional, Type, List
 from pydantic import BaseModel, create_model, Field, RootModel
 import json
 
 
+ROOT_MODEL_CACHE_SIZE = 256
+
+
 # Type mapping from schema types to Python types
 TYPE_MAPPING = {
     "string": str,
@@ -62,10 +66,28 @@ def schema_to_root_model(
     field_def: Dict[str, Any],
     model_name: str = "RootModel"
 ) -> Type[BaseModel]:
-    """Convert a single field schema into a RootModel for flat output validation."""
+    """
+    Convert a single field schema into a RootModel for flat output validation.
+
+    Models are memoized on the field definition's content, so a schema
+    edited mid-execution gets a fresh model on its next lookup.
+    """
     if isinstance(field_def, str):
         field_def = {"type": field_def}
 
+    try:
+        key = json.dumps(field_def, sort_keys=True)
+    except (TypeError, ValueError):
+        return _build_root_model(field_def, model_name)
+    return _cached_root_model(key, model_name)
+
+
+@lru_cache(maxsize=ROOT_MODEL_CACHE_SIZE)
+def _cached_root_model(field_def_json: str, model_name: str) -> Type[BaseModel]:
+    return _build_root_model(json.loads(field_def_json), model_name)
+
+
+def _build_root_model(field_def: Dict[str, Any], model_name: str) -> Type[BaseModel]:
     root_type = _schema_field_to_type(field_def, model_name=model_name)
 
     class DynamicRoot(RootModel[root_type]):
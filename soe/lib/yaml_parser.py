@@ -3,12 +3,17 @@
 import yaml
 from typing import Dict, Any, Union
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 def parse_yaml(data: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """Parse YAML string to dict, or return dict as-is."""
     if isinstance(data, str):
         try:
-            return yaml.safe_load(data)
+            return yaml.load(data, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}")
     return data
@@ -61,6 +61,7 @@ def create_local_backends(
     conversation_history_storage_dir: Optional[str] = "./orchestration_data/conversations",
     context_schema_storage_dir: Optional[str] = "./orchestration_data/schemas",
     identity_storage_dir: Optional[str] = "./orchestration_data/identities",
+    async_writes: bool = False,
 ) -> LocalBackends:
     """
     Create local file-based backends for testing and development
@@ -72,11 +73,13 @@ def create_local_backends(
         conversation_history_storage_dir: Directory for conversation history storage (optional)
         context_schema_storage_dir: Directory for context schema storage (optional)
         identity_storage_dir: Directory for identity storage (optional)
+        async_writes: Persist context and conversation history from a
+            background thread (call flush() on those backends to wait)
 
     Returns:
         LocalBackends instance with context, workflow, and optional backends
     """
-    context_backend = LocalContextBackend(context_storage_dir)
+    context_backend = LocalContextBackend(context_storage_dir, async_writes=async_writes)
     workflow_backend = LocalWorkflowBackend(workflow_storage_dir)
 
     telemetry_backend = None
@@ -86,7 +89,7 @@ def create_local_backends(
     conversation_history_backend = None
     if conversation_history_storage_dir:
         conversation_history_backend = LocalConversationHistoryBackend(
-            conversation_history_storage_dir
+            conversation_history_storage_dir, async_writes=async_writes
         )
 
     context_schema_backend = None
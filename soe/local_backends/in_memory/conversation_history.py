@@ -35,6 +35,18 @@ class InMemoryConversationHistoryBackend:
             self._history[identity] = []
         self._history[identity].append(entry)
 
+    def append_many_to_conversation_history(
+        self, identity: str, entries: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Append several entries to conversation history
+
+        Args:
+            identity: User/Agent identity
+            entries: Message entries to append, in order
+        """
+        self._history.setdefault(identity, []).extend(entries)
+
     def save_conversation_history(self, identity: str, history: List[Dict[str, Any]]) -> None:
         """
         Save full conversation history
@@ -29,6 +29,16 @@ class InMemoryTelemetryBackend:
         }
         self._events[execution_id].append(event)
 
+    def log_events_batch(self, execution_id: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Log several telemetry events at once
+
+        Args:
+            execution_id: Execution ID
+            events: Event dicts, each with an 'event_type' key
+        """
+        self._events.setdefault(execution_id, []).extend(dict(event) for event in events)
+
     def get_events(self, execution_id: str) -> List[Dict[str, Any]]:
         """Get all events for an execution ID"""
         return self._events.get(execution_id, [])
@@ -1,23 +1,31 @@
 """In-memory workflow backend - dumb storage only."""
 
 from typing import Dict, Any
-import copy
+import pickle
 
 
 class InMemoryWorkflowBackend:
-    """In-memory workflow storage backend."""
+    """In-memory workflow storage backend.
+
+    Registries are stored as pickled snapshots: saving serializes once and
+    each read unpickles a fresh, independent copy, which is considerably
+    cheaper than copy.deepcopy for nested containers.
+    """
 
     def __init__(self):
-        self._registries: Dict[str, Any] = {}
+        self._registries: Dict[str, bytes] = {}
         self._current_workflows: Dict[str, str] = {}
 
     def save_workflows_registry(self, id: str, workflows: Dict[str, Any]) -> None:
         """Save workflows registry for execution ID."""
-        self._registries[id] = copy.deepcopy(workflows)
+        self._registries[id] = pickle.dumps(workflows, protocol=pickle.HIGHEST_PROTOCOL)
 
     def get_workflows_registry(self, id: str) -> Any:
         """Get workflows registry for execution ID."""
-        return copy.deepcopy(self._registries.get(id))
+        snapshot = self._registries.get(id)
+        if snapshot is None:
+            return None
+        return pickle.loads(snapshot)
 
     def save_current_workflow_name(self, id: str, name: str) -> None:
         """Save current workflow name for execution ID."""
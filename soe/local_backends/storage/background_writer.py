@@ -0,0 +1,136 @@
+"""
+Background file writer for local storage backends.
+
+Moves JSON persistence off the caller's thread. Writes are queued and
+drained by a single daemon thread, which coalesces consecutive writes to
+the same path (only the latest content is written) and replaces each file
+atomically.
+
+Contents stay readable through pending() until they are on disk, so
+callers get read-your-writes without keeping their own cache. All
+async backends share the process-wide writer from get_background_writer().
+"""
+
+import atexit
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+DEFAULT_QUEUE_SIZE = 1024
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Write data to a temporary file and move it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class BackgroundWriter:
+    """Single-thread writer that persists file contents asynchronously"""
+
+    def __init__(self, max_queue_size: int = DEFAULT_QUEUE_SIZE):
+        self._queue: "queue.Queue[Tuple[Path, str]]" = queue.Queue(maxsize=max_queue_size)
+        self._pending: Dict[Path, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._error: Optional[Exception] = None
+
+    def submit(self, path: Path, data: str) -> None:
+        """
+        Queue file contents to be written
+
+        Blocks only when the queue is full.
+
+        Args:
+            path: Destination file path
+            data: Full file contents
+        """
+        self._ensure_started()
+        with self._lock:
+            self._pending[path] = data
+        self._queue.put((path, data))
+
+    def pending(self, path: Path) -> Optional[str]:
+        """
+        Get the latest contents queued for a path that are not yet on disk
+
+        Args:
+            path: File path
+
+        Returns:
+            Queued contents, or None if the file on disk is up to date
+        """
+        return self._pending.get(path)
+
+    def flush(self) -> None:
+        """
+        Block until every queued write has been persisted
+
+        Raises:
+            OSError: If a background write failed since the last flush
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._drain, daemon=True)
+                thread.start()
+                self._thread = thread
+                atexit.register(self.flush)
+
+    def _drain(self) -> None:
+        while True:
+            path, data = self._queue.get()
+            batch: Dict[Path, str] = {path: data}
+            taken = 1
+
+            while True:
+                try:
+                    path, data = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch[path] = data
+                taken += 1
+
+            try:
+                for path, data in batch.items():
+                    try:
+                        _write_atomic(path, data)
+                    except OSError as e:
+                        # Keep the contents readable; flush() reports the error
+                        self._error = e
+                        continue
+                    with self._lock:
+                        # A newer submit for the path keeps its entry
+                        if self._pending.get(path) is data:
+                            del self._pending[path]
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+
+_shared_writer: Optional[BackgroundWriter] = None
+_shared_writer_lock = threading.Lock()
+
+
+def get_background_writer() -> BackgroundWriter:
+    """Get the process-wide background writer, creating it on first use."""
+    global _shared_writer
+    if _shared_writer is None:
+        with _shared_writer_lock:
+            if _shared_writer is None:
+                _shared_writer = BackgroundWriter()
+    return _shared_writer
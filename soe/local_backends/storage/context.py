@@ -3,22 +3,32 @@ Local file-based context backend
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from .background_writer import BackgroundWriter, get_background_writer
 
 
 class LocalContextBackend:
     """File-based context storage backend"""
 
-    def __init__(self, storage_dir: str = "./orchestration_data/contexts"):
+    def __init__(
+        self,
+        storage_dir: str = "./orchestration_data/contexts",
+        async_writes: bool = False,
+    ):
         """
         Initialize local context backend
 
         Args:
             storage_dir: Directory to store context files
+            async_writes: If True, files are written by the shared background
+                writer and reads see queued contents until they are on disk
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._writer: Optional[BackgroundWriter] = get_background_writer() if async_writes else None
 
     def get_context(self, execution_id: str) -> Dict[str, Any]:
         """
@@ -32,11 +42,15 @@ class LocalContextBackend:
         """
         context_file = self.storage_dir / f"{execution_id}.json"
 
-        if not context_file.exists():
-            return {}
+        if self._writer is not None:
+            pending = self._writer.pending(context_file)
+            if pending is not None:
+                return json.loads(pending)
 
-        with open(context_file, "r") as f:
-            return json.load(f)
+        try:
+            return json.loads(context_file.read_bytes())
+        except FileNotFoundError:
+            return {}
 
     def save_context(self, execution_id: str, context: Dict[str, Any]) -> None:
         """
@@ -48,10 +62,23 @@ class LocalContextBackend:
         """
         context_file = self.storage_dir / f"{execution_id}.json"
 
+        if self._writer is not None:
+            data = json.dumps(context, indent=2, default=str)
+            self._writer.submit(context_file, data)
+            return
+
         with open(context_file, "w") as f:
             json.dump(context, f, indent=2, default=str)
 
+    def flush(self) -> None:
+        """Block until all pending background writes are on disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
     def cleanup_all(self) -> None:
         """Delete all context files. Used for test cleanup."""
-        for context_file in self.storage_dir.glob("*.json"):
-            context_file.unlink()
+        self.flush()
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    os.unlink(entry.path)
@@ -6,22 +6,32 @@ to persist their conversation state across different node executions.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from .background_writer import BackgroundWriter, get_background_writer
 
 
 class LocalConversationHistoryBackend:
     """File-based conversation history storage backend"""
 
-    def __init__(self, storage_dir: str = "./orchestration_data/conversations"):
+    def __init__(
+        self,
+        storage_dir: str = "./orchestration_data/conversations",
+        async_writes: bool = False,
+    ):
         """
         Initialize local conversation history backend
 
         Args:
             storage_dir: Directory to store conversation history files
+            async_writes: If True, files are written by the shared background
+                writer and reads see queued contents until they are on disk
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._writer: Optional[BackgroundWriter] = get_background_writer() if async_writes else None
 
     def get_conversation_history(self, identity: str) -> List[Dict[str, Any]]:
         """
@@ -35,11 +45,15 @@ class LocalConversationHistoryBackend:
         """
         history_file = self.storage_dir / f"{identity}.json"
 
-        if not history_file.exists():
-            return []
+        if self._writer is not None:
+            pending = self._writer.pending(history_file)
+            if pending is not None:
+                return json.loads(pending)
 
-        with open(history_file, "r") as f:
-            return json.load(f)
+        try:
+            return json.loads(history_file.read_bytes())
+        except FileNotFoundError:
+            return []
 
     def append_to_conversation_history(
         self, identity: str, entry: Dict[str, Any]
@@ -51,8 +65,20 @@ class LocalConversationHistoryBackend:
             identity: Unique identity identifier for the agent
             entry: Conversation entry to append
         """
+        self.append_many_to_conversation_history(identity, [entry])
+
+    def append_many_to_conversation_history(
+        self, identity: str, entries: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Append several entries to the conversation history with one write
+
+        Args:
+            identity: Unique identity identifier for the agent
+            entries: Conversation entries to append, in order
+        """
         history = self.get_conversation_history(identity)
-        history.append(entry)
+        history.extend(entries)
         self.save_conversation_history(identity, history)
 
     def save_conversation_history(
@@ -67,16 +93,30 @@ class LocalConversationHistoryBackend:
         """
         history_file = self.storage_dir / f"{identity}.json"
 
+        if self._writer is not None:
+            data = json.dumps(history, indent=2, default=str)
+            self._writer.submit(history_file, data)
+            return
+
         with open(history_file, "w") as f:
             json.dump(history, f, indent=2, default=str)
 
     def delete_conversation_history(self, identity: str) -> None:
         """Delete conversation history for an identity."""
+        self.flush()
         history_file = self.storage_dir / f"{identity}.json"
         if history_file.exists():
             history_file.unlink()
 
+    def flush(self) -> None:
+        """Block until all pending background writes are on disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
     def cleanup_all(self) -> None:
         """Delete all conversation history files. Used for test cleanup."""
-        for history_file in self.storage_dir.glob("*.json"):
-            history_file.unlink()
+        self.flush()
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    os.unlink(entry.path)
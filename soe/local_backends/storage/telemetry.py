@@ -1,11 +1,22 @@
 """
 Local file-based telemetry backend - dumb storage only.
+
+Events are stored one JSON value per line with event types interned:
+
+    {"types": ["orchestration_start", "signals_broadcast"]}
+    [0, {"timestamp": "...", "context": {...}}]
+    [1, {"timestamp": "...", "context": {...}}]
+
+A ``{"types": [...]}`` line extends the per-file type table and is written
+the first time a new event type is logged. Event frames are
+``[type_id, data]`` pairs indexing into that table. Plain event dicts
+(the previous format) are still read as-is.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
-from ...types import EventTypes
+from typing import Dict, Any, List, Tuple
 
 
 class LocalTelemetryBackend:
@@ -20,6 +31,61 @@ class LocalTelemetryBackend:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # execution_id -> (file size after our last write, type table)
+        self._type_tables: Dict[str, Tuple[int, List[str]]] = {}
+
+    def _get_type_table(self, execution_id: str, telemetry_file: Path) -> List[str]:
+        """Get the type table for an execution, reloading it from disk if the
+        file changed since our last write (another writer, or deleted)."""
+        try:
+            size = telemetry_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+
+        cached = self._type_tables.get(execution_id)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+
+        types = self._read_type_table(telemetry_file) if size else []
+        self._type_tables[execution_id] = (size, types)
+        return types
+
+    def _read_type_table(self, telemetry_file: Path) -> List[str]:
+        types: List[str] = []
+        with open(telemetry_file, "r") as f:
+            for line in f:
+                if not line.startswith('{"types"'):
+                    continue
+                try:
+                    types.extend(json.loads(line)["types"])
+                except (json.JSONDecodeError, KeyError):
+                    continue
+        return types
+
+    def _encode_events(
+        self, execution_id: str, telemetry_file: Path, events: List[Dict[str, Any]]
+    ) -> str:
+        """Encode events as frames, prefixed by a type line for any new types."""
+        types = self._get_type_table(execution_id, telemetry_file)
+        # Ids are positions in the table; keep the first on duplicates
+        type_ids = {event_type: i for i, event_type in reversed(list(enumerate(types)))}
+        new_types: List[str] = []
+        frames: List[str] = []
+
+        for event in events:
+            data = dict(event)
+            event_type = data.pop("event_type")
+            type_id = type_ids.get(event_type)
+            if type_id is None:
+                type_id = len(types)
+                type_ids[event_type] = type_id
+                types.append(event_type)
+                new_types.append(event_type)
+            frames.append(json.dumps([type_id, data]) + "\n")
+
+        if new_types:
+            frames.insert(0, json.dumps({"types": new_types}) + "\n")
+        return "".join(frames)
 
     def log_event(self, execution_id: str, event_type: str, **event_data) -> None:
         """
@@ -30,17 +96,28 @@ class LocalTelemetryBackend:
             event_type: Type of event (use EventTypes constants)
             **event_data: Additional event-specific data (caller provides timestamp)
         """
-        event = {
-            "event_type": event_type,
-            **event_data,
-        }
+        self.log_events_batch(execution_id, [{"event_type": event_type, **event_data}])
+
+    def log_events_batch(self, execution_id: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Log several events for an execution ID with a single write
+
+        Args:
+            execution_id: Unique execution identifier
+            events: Event dicts, each with an 'event_type' key
+        """
+        if not events:
+            return
 
         telemetry_file = self.storage_dir / f"{execution_id}.jsonl"
+        data = self._encode_events(execution_id, telemetry_file, events)
 
         with open(telemetry_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+            f.write(data)
+            size = f.tell()
+        self._type_tables[execution_id] = (size, self._type_tables[execution_id][1])
 
-    def get_events(self, execution_id: str) -> list[Dict[str, Any]]:
+    def get_events(self, execution_id: str) -> List[Dict[str, Any]]:
         """
         Get all events for execution ID
 
@@ -55,18 +132,35 @@ class LocalTelemetryBackend:
         if not telemetry_file.exists():
             return []
 
+        types: List[str] = []
         events = []
         with open(telemetry_file, "r") as f:
             for line in f:
                 line = line.strip()
-                if line:
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if isinstance(record, list):
                     try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
+                        type_id, data = record
+                        event_type = types[type_id]
+                    except (ValueError, TypeError, IndexError):
                         continue
+                    events.append({"event_type": event_type, **data})
+                elif "types" in record and "event_type" not in record:
+                    types.extend(record["types"])
+                else:
+                    events.append(record)
         return events
 
     def cleanup_all(self) -> None:
         """Delete all telemetry files. Used for test cleanup."""
-        for telemetry_file in self.storage_dir.glob("*.jsonl"):
-            telemetry_file.unlink()
+        self._type_tables.clear()
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".jsonl"):
+                    os.unlink(entry.path)
@@ -1,6 +1,7 @@
 """Local file-based workflow backend - dumb storage only."""
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, Any
 
@@ -25,12 +26,11 @@ class LocalWorkflowBackend:
         """Get workflows registry for execution ID."""
         workflows_file = self.storage_dir / f"{execution_id}_workflows.json"
 
-        if not workflows_file.exists():
+        try:
+            return json.loads(workflows_file.read_bytes())
+        except FileNotFoundError:
             return {}
 
-        with open(workflows_file, "r") as f:
-            return json.load(f)
-
     def save_current_workflow_name(self, execution_id: str, workflow_name: str) -> None:
         """Save current workflow name for execution ID."""
         current_workflow_file = self.storage_dir / f"{execution_id}_current.txt"
@@ -50,7 +50,7 @@ class LocalWorkflowBackend:
 
     def cleanup_all(self) -> None:
         """Delete all workflow files. Used for test cleanup."""
-        for workflow_file in self.storage_dir.glob("*_workflows.json"):
-            workflow_file.unlink()
-        for current_file in self.storage_dir.glob("*_current.txt"):
-            current_file.unlink()
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(("_workflows.json", "_current.txt")):
+                    os.unlink(entry.path)
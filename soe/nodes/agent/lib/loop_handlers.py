@@ -5,13 +5,19 @@ Focused functions for handling each router action type.
 Extracted from factory.py to keep the main loop clean.
 """
 
-from typing import Dict, Any, Callable, TYPE_CHECKING
+import contextvars
+import reprlib
+import sys
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Callable, List, Optional, Tuple, TYPE_CHECKING
+from pydantic import ValidationError
 from ..stages import (
     execute_response_stage,
     execute_parameter_stage,
     FinalResponse,
 )
 from ...lib.tools import create_tool_schema
+from ....builtin_tools import get_builtin_tool_factory
 from ...lib.output import get_signal_options, get_output_model
 
 if TYPE_CHECKING:
@@ -21,6 +27,32 @@ if TYPE_CHECKING:
     from ....types import Backends
 
 
+MAX_PARALLEL_TOOL_CALLS = 8
+
+RESULT_PREVIEW_CHARS = 1000
+
+# Builds telemetry previews without stringifying a whole container first
+_result_repr = reprlib.Repr()
+_result_repr.maxstring = RESULT_PREVIEW_CHARS
+_result_repr.maxother = RESULT_PREVIEW_CHARS
+_result_repr.maxlist = _result_repr.maxtuple = _result_repr.maxdict = 50
+_result_repr.maxset = _result_repr.maxfrozenset = 50
+
+# Seconds a single tool attempt may run; a registry entry can override it,
+# or disable it with "timeout": None
+DEFAULT_TOOL_TIMEOUT = 30
+
+# Worker threads shared by all timed tool calls. Sized well above
+# MAX_PARALLEL_TOOL_CALLS so a few hung tools do not starve other agents.
+TOOL_TIMEOUT_WORKERS = 32
+_tool_timeout_executor = ThreadPoolExecutor(
+    max_workers=TOOL_TIMEOUT_WORKERS, thread_name_prefix="soe-tool"
+)
+
+# Errors that will not go away by calling the tool again with the same arguments
+NON_RETRYABLE_TOOL_ERRORS = (ValidationError, TypeError)
+
+
 def handle_finish_action(
     call_llm: "CallLlm",
     agent_context: "AgentContext",
@@ -57,17 +89,22 @@ def handle_tool_call_action(
     operational_state: "AgentOperationalState",
     backends: "Backends",
     execution_id: str,
+    conversation_history: Optional[str] = None,
+    proposed_args: Optional[Dict[str, Any]] = None,
 ) -> bool:
-    """Handle the 'call_tool' action from the router."""
-    from ....lib.register_event import register_event
+    """
+    Handle the 'call_tool' action from the router.
+
+    Arguments the router proposed alongside the tool name are used when
+    they validate against the tool schema; otherwise the parameter stage
+    asks for them.
+    """
     from ....types import EventTypes
 
     if not tool_name or tool_name not in tools_registry:
-        register_event(
-            backends=backends,
-            execution_id=execution_id,
-            event_type=EventTypes.AGENT_TOOL_NOT_FOUND,
-            data={
+        loop_state.record_event(
+            EventTypes.AGENT_TOOL_NOT_FOUND,
+            {
                 "node_name": node_config.get("name", "unknown"),
                 "tool_name": tool_name,
                 "available_tools": list(tools_registry.keys()),
@@ -79,68 +116,228 @@ def handle_tool_call_action(
     tool_config = tools_registry[tool_name]
     tool_func = tool_config["function"]
     tool_exec_retries = tool_config.get("max_retries", 0)
+    tool_timeout = tool_config.get("timeout", DEFAULT_TOOL_TIMEOUT)
+    # Builtin tools read and change live workflow state, so they are never cached
+    cacheable = tool_config.get("cacheable", True) and not get_builtin_tool_factory(tool_name)
     tool_schema = create_tool_schema(tool_func)
 
     try:
-        tool_args = execute_parameter_stage(
-            call_llm=call_llm,
-            agent_context=agent_context,
-            loop_state=loop_state,
-            tool_name=tool_name,
-            tool_schema=tool_schema,
-            config=node_config,
-            max_retries=operational_state.max_retries,
-        )
+        tool_args = _validate_proposed_args(tool_schema, proposed_args)
+        if tool_args is None and tool_schema.model_fields:
+            tool_args = execute_parameter_stage(
+                call_llm=call_llm,
+                agent_context=agent_context,
+                loop_state=loop_state,
+                tool_name=tool_name,
+                tool_schema=tool_schema,
+                config=node_config,
+                max_retries=operational_state.max_retries,
+                conversation_history=conversation_history,
+            )
+        elif tool_args is None:
+            # Nothing for the LLM to fill in, so skip the parameter stage
+            tool_args = tool_schema()
 
         tool_args_dict = tool_args.model_dump() if hasattr(tool_args, 'model_dump') else dict(tool_args)
 
-        register_event(
-            backends=backends,
-            execution_id=execution_id,
-            event_type=EventTypes.AGENT_TOOL_CALL,
-            data={
+        cache_key = loop_state.tool_result_key(tool_name, tool_args_dict) if cacheable else None
+        if cache_key is not None and cache_key in loop_state.tool_result_cache:
+            loop_state.record_event(
+                EventTypes.AGENT_TOOL_CACHE_HIT,
+                {
+                    "node_name": node_config.get("name", "unknown"),
+                    "tool_name": tool_name,
+                    "tool_args": tool_args_dict,
+                }
+            )
+            loop_state.add_tool_response(tool_name, loop_state.tool_result_cache[cache_key])
+            return True
+
+        loop_state.record_event(
+            EventTypes.AGENT_TOOL_CALL,
+            {
                 "node_name": node_config.get("name", "unknown"),
                 "tool_name": tool_name,
                 "tool_args": tool_args_dict,
             }
         )
 
-        result = _execute_tool_with_retries(tool_func, tool_args, tool_exec_retries)
+        result = _execute_tool_with_retries(
+            tool_func, tool_args_dict, tool_exec_retries, tool_timeout
+        )
 
-        result_str = str(result)
-        result_preview = result_str[:1000] + "..." if len(result_str) > 1000 else result_str
+        result_preview, result_length = _preview_result(result)
 
-        register_event(
-            backends=backends,
-            execution_id=execution_id,
-            event_type=EventTypes.AGENT_TOOL_RESULT,
-            data={
+        loop_state.record_event(
+            EventTypes.AGENT_TOOL_RESULT,
+            {
                 "node_name": node_config.get("name", "unknown"),
                 "tool_name": tool_name,
                 "result_preview": result_preview,
-                "result_length": len(result_str),
+                "result_length": result_length,
             }
         )
 
+        if cache_key is not None:
+            loop_state.tool_result_cache[cache_key] = result
         loop_state.add_tool_response(tool_name, result)
 
+    except TimeoutError as e:
+        loop_state.add_tool_error(tool_name, str(e), abort=True)
+
     except Exception as e:
         loop_state.add_tool_error(tool_name, str(e))
 
     return True
 
 
+def handle_tool_calls_action(
+    call_llm: "CallLlm",
+    tool_names: List[Optional[str]],
+    tools_registry: Dict[str, Dict[str, Any]],
+    agent_context: "AgentContext",
+    loop_state: "AgentLoopState",
+    node_config: Dict[str, Any],
+    operational_state: "AgentOperationalState",
+    backends: "Backends",
+    execution_id: str,
+    tool_args: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Handle a 'call_tool' action naming one or more tools.
+
+    tool_args are the router's proposed arguments; they only apply to a
+    single tool call.
+
+    Independent tool calls (parameter stage + execution) run concurrently
+    in a thread pool, so a turn takes as long as its slowest call instead
+    of the sum of all calls. A single call runs inline.
+
+    Every parallel parameter stage sees the history as it was before
+    dispatch. Builtin tools read-modify-write shared backends, so they run
+    one at a time on the calling thread while registered tools run in
+    the pool.
+    """
+    if len(tool_names) <= 1:
+        conversation_history = None
+    else:
+        conversation_history = loop_state.get_context_for_llm()
+
+    def call_tool(tool_name: Optional[str]) -> bool:
+        return handle_tool_call_action(
+            call_llm=call_llm,
+            tool_name=tool_name,
+            tools_registry=tools_registry,
+            agent_context=agent_context,
+            loop_state=loop_state,
+            node_config=node_config,
+            operational_state=operational_state,
+            backends=backends,
+            execution_id=execution_id,
+            conversation_history=conversation_history,
+        )
+
+    if len(tool_names) <= 1:
+        handle_tool_call_action(
+            call_llm=call_llm,
+            tool_name=tool_names[0] if tool_names else None,
+            tools_registry=tools_registry,
+            agent_context=agent_context,
+            loop_state=loop_state,
+            node_config=node_config,
+            operational_state=operational_state,
+            backends=backends,
+            execution_id=execution_id,
+            proposed_args=tool_args,
+        )
+        return
+
+    builtin_names = [name for name in tool_names if name and get_builtin_tool_factory(name)]
+    pooled_names = [name for name in tool_names if name not in builtin_names]
+
+    max_workers = min(max(len(pooled_names), 1), MAX_PARALLEL_TOOL_CALLS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each call gets its own copy of the caller's contextvars
+        futures = [
+            executor.submit(contextvars.copy_context().run, call_tool, name)
+            for name in pooled_names
+        ]
+        for name in builtin_names:
+            call_tool(name)
+        for future in futures:
+            future.result()
+
+
+def _validate_proposed_args(tool_schema: Any, proposed_args: Optional[Dict[str, Any]]) -> Any:
+    """Validate router-proposed arguments, or return None to fall back to the parameter stage."""
+    if proposed_args is None:
+        return None
+    try:
+        return tool_schema.model_validate(proposed_args)
+    except ValidationError:
+        return None
+
+
+def _preview_result(result: Any) -> Tuple[str, int]:
+    """
+    Build a bounded telemetry preview of a tool result.
+
+    Strings are sliced directly; other results go through reprlib, which
+    stops after the first items of large containers. The length is exact
+    for strings and a sys.getsizeof approximation otherwise.
+    """
+    if isinstance(result, str):
+        if len(result) > RESULT_PREVIEW_CHARS:
+            return result[:RESULT_PREVIEW_CHARS] + "...", len(result)
+        return result, len(result)
+    return _result_repr.repr(result), sys.getsizeof(result)
+
+
+def _call_with_timeout(
+    tool_func: Callable,
+    kwargs: Dict[str, Any],
+    timeout: Optional[float],
+) -> Any:
+    """Call a tool, raising TimeoutError if it runs longer than timeout seconds.
+
+    The tool runs on a shared worker thread inside a copy of the caller's
+    contextvars, so tracing spans and other request-scoped state carry over.
+    On timeout the caller moves on, but the tool keeps running in the
+    background (Python threads cannot be cancelled) and holds its worker
+    until it returns; interpreter exit waits for it.
+    """
+    if timeout is None:
+        return tool_func(**kwargs)
+
+    call_context = contextvars.copy_context()
+    future = _tool_timeout_executor.submit(call_context.run, tool_func, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        # Drops the call if it is still queued behind busy workers
+        future.cancel()
+        raise TimeoutError(f"Tool timed out after {timeout}s") from None
+
+
 def _execute_tool_with_retries(
     tool_func: Callable,
-    tool_args: Any,
+    tool_args: Dict[str, Any],
     max_retries: int,
+    timeout: Optional[float] = None,
 ) -> Any:
-    """Execute a tool with retry logic."""
+    """Execute a tool with retry logic.
+
+    Each attempt is bounded by timeout when set. Argument errors
+    (NON_RETRYABLE_TOOL_ERRORS) are raised immediately; anything else,
+    including timeouts, is retried up to max_retries times.
+    """
     last_error = None
 
     for attempt in range(max_retries + 1):
         try:
-            return tool_func(**tool_args.model_dump())
+            return _call_with_timeout(tool_func, tool_args, timeout)
+        except NON_RETRYABLE_TOOL_ERRORS:
+            raise
         except Exception as e:
             last_error = e
             if attempt < max_retries:
@@ -7,14 +7,40 @@ is persisted to the backend, allowing it to be shared across different
 node executions.
 """
 
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Callable, List, Optional, Tuple, Type, TypeVar, TYPE_CHECKING
+from pydantic import BaseModel
+
+from ....lib.register_event import event_timestamp, register_events
 
 if TYPE_CHECKING:
     from ....types import Backends
 
+T = TypeVar("T", bound=BaseModel)
+
+# Persisted history entries are buffered and written in batches of this size,
+# and at the end of every loop iteration
+PERSIST_BATCH_SIZE = 5
+
+# Most recent history entries included in LLM prompts
+DEFAULT_CONTEXT_WINDOW = 10
+
+# Tool results longer than this are cut in LLM prompts
+MAX_TOOL_RESULT_CHARS = 2000
+TRUNCATION_MARKER = "...[truncated]"
+
+# Execution state implied by the role of the last history entry
+_STATE_BY_ROLE = {
+    "tool": "tool_response",
+    "tool_error": "tool_error",
+    "system_error": "retry",
+}
 
-class AgentLoopState(BaseModel):
+
+class AgentLoopState:
     """
     Internal state for the agent execution loop.
 
@@ -22,16 +48,62 @@ class AgentLoopState(BaseModel):
     execution. When `identity` is set, conversation history is loaded from
     and saved to the conversation_history backend, enabling persistence
     across different node executions.
+
+    Mutators are guarded by a lock so tool calls running in parallel can
+    record their results safely.
+
+    This is a plain slotted class rather than a pydantic model: it is
+    never serialized and is mutated on every tool call.
     """
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    __slots__ = (
+        "tool_responses",
+        "conversation_history",
+        "errors",
+        "retry_count",
+        "max_retries",
+        "history_key",
+        "context_window",
+        "abort",
+        "has_tool_errors",
+        "tool_result_cache",
+        "pending_events",
+        "_backends",
+        "_lock",
+        "_llm_cache",
+        "_execution_state",
+        "_pending_persist",
+        "_formatted_source",
+        "_formatted_entries",
+        "_formatted_text",
+    )
 
-    tool_responses: Dict[str, Any] = Field(default_factory=dict)
-    conversation_history: List[Dict[str, str]] = Field(default_factory=list)
-    errors: List[str] = Field(default_factory=list)
-    retry_count: int = 0
-    max_retries: int = 10
-    history_key: Optional[str] = None
-    _backends: Optional["Backends"] = PrivateAttr(default=None)
+    def __init__(
+        self,
+        max_retries: int = 10,
+        history_key: Optional[str] = None,
+        context_window: int = DEFAULT_CONTEXT_WINDOW,
+    ):
+        self.tool_responses: Dict[str, Any] = {}
+        self.conversation_history: List[Dict[str, str]] = []
+        self.errors: List[str] = []
+        self.retry_count = 0
+        self.max_retries = max_retries
+        self.history_key = history_key
+        self.context_window = context_window
+        self.abort = False
+        self.has_tool_errors = False
+        # Results of cacheable tools keyed by tool_result_key(), for this execution only
+        self.tool_result_cache: Dict[str, Any] = {}
+        self.pending_events: List[Tuple[str, Dict[str, Any], str]] = []
+        self._backends: Optional["Backends"] = None
+        self._lock = threading.Lock()
+        self._llm_cache: Dict[str, "Future[Any]"] = {}
+        self._execution_state = "initial"
+        self._pending_persist: List[Dict[str, str]] = []
+        # History list the formatted entries were built from, and the entries themselves
+        self._formatted_source: Optional[List[Dict[str, str]]] = None
+        self._formatted_entries: List[str] = []
+        self._formatted_text: Optional[str] = None
 
     @classmethod
     def create(
@@ -39,73 +111,173 @@ class AgentLoopState(BaseModel):
         history_key: Optional[str] = None,
         backends: Optional["Backends"] = None,
         max_retries: int = 10,
+        context_window: int = DEFAULT_CONTEXT_WINDOW,
+        conversation_history: Optional[List[Dict[str, Any]]] = None,
     ) -> "AgentLoopState":
         """
         Factory method to create AgentLoopState, optionally loading
         existing conversation history from backend.
 
+        Callers that already loaded the history pass it in, so the
+        transcript is not fetched from the backend a second time.
+
         Args:
             history_key: Optional key for persistent conversation history (main_execution_id)
             backends: Backends container (required if history_key is set)
             max_retries: Maximum retry count
+            context_window: Number of recent history entries shown to the LLM
+            conversation_history: History already loaded for history_key, if any
 
         Returns:
             AgentLoopState instance, with history loaded if history_key exists
         """
-        state = cls(max_retries=max_retries, history_key=history_key)
+        state = cls(max_retries=max_retries, history_key=history_key, context_window=context_window)
         state._backends = backends
 
         if history_key and backends and backends.conversation_history:
-            state.conversation_history = backends.conversation_history.get_conversation_history(history_key)
+            if conversation_history is None:
+                conversation_history = backends.conversation_history.get_conversation_history(history_key)
+            state.conversation_history = conversation_history
+            if state.conversation_history:
+                last_role = state.conversation_history[-1].get("role", "")
+                state._execution_state = _STATE_BY_ROLE.get(last_role, "initial")
 
         return state
 
     def add_tool_response(self, tool_name: str, result: Any) -> None:
         """Record a successful tool response."""
-        self.tool_responses[tool_name] = result
         entry = {
             "role": "tool",
             "tool_name": tool_name,
             "content": str(result),
         }
-        self.conversation_history.append(entry)
-        self._persist_entry(entry)
+        with self._lock:
+            self.tool_responses[tool_name] = result
+            self.conversation_history.append(entry)
+            self._execution_state = "tool_response"
+            self._persist_entry(entry)
 
-    def add_tool_error(self, tool_name: str, error: str) -> None:
-        """Record a tool execution error."""
+    def add_tool_error(self, tool_name: str, error: str, abort: bool = False) -> None:
+        """Record a tool execution error, optionally aborting the loop."""
         error_msg = f"Error executing {tool_name}: {error}"
-        self.tool_responses[tool_name] = error_msg
-        self.errors.append(error_msg)
         entry = {
             "role": "tool_error",
             "tool_name": tool_name,
             "content": error_msg,
         }
-        self.conversation_history.append(entry)
-        self._persist_entry(entry)
-        self.retry_count += 1
+        with self._lock:
+            self.tool_responses[tool_name] = error_msg
+            self.errors.append(error_msg)
+            self.conversation_history.append(entry)
+            self._execution_state = "tool_error"
+            self.has_tool_errors = True
+            self._persist_entry(entry)
+            self.retry_count += 1
+            if abort:
+                self.abort = True
 
     def add_system_error(self, error: str) -> None:
         """Record a system-level error (e.g., invalid tool name)."""
-        self.errors.append(error)
         entry = {
             "role": "system_error",
             "content": error,
         }
-        self.conversation_history.append(entry)
-        self._persist_entry(entry)
-        self.retry_count += 1
+        with self._lock:
+            self.errors.append(error)
+            self.conversation_history.append(entry)
+            self._execution_state = "retry"
+            self._persist_entry(entry)
+            self.retry_count += 1
 
     def _persist_entry(self, entry: Dict[str, str]) -> None:
-        """Persist a single entry to the backend if history_key is set."""
+        """Buffer an entry for the backend if history_key is set (caller holds the lock)."""
         if self.history_key and self._backends and self._backends.conversation_history:
-            self._backends.conversation_history.append_to_conversation_history(
-                self.history_key, entry
-            )
+            self._pending_persist.append(entry)
+            if len(self._pending_persist) >= PERSIST_BATCH_SIZE:
+                self._write_pending_persist()
+
+    def _write_pending_persist(self) -> None:
+        entries, self._pending_persist = self._pending_persist, []
+        if not entries:
+            return
+        history_backend = self._backends.conversation_history
+        append_many = getattr(history_backend, "append_many_to_conversation_history", None)
+        if append_many is not None:
+            append_many(self.history_key, entries)
+        else:
+            for entry in entries:
+                history_backend.append_to_conversation_history(self.history_key, entry)
+
+    def flush_history(self) -> None:
+        """Write buffered conversation history entries to the backend."""
+        with self._lock:
+            self._write_pending_persist()
+
+    def record_event(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Queue an event, stamped now, to be registered on the next flush."""
+        timestamp = event_timestamp()
+        with self._lock:
+            self.pending_events.append((event_type, data, timestamp))
+
+    def flush_events(self, execution_id: str) -> None:
+        """Register all queued events in a single batch."""
+        if not self.pending_events or not self._backends:
+            return
+        with self._lock:
+            events, self.pending_events = self.pending_events, []
+        register_events(self._backends, execution_id, events)
+
+    def resolve_llm_call_once(
+        self,
+        input_data: BaseModel,
+        response_model: Type[T],
+        resolve: Callable[[], T],
+    ) -> T:
+        """
+        Resolve a stage LLM call, reusing the result for an identical input.
+
+        The cache lives on this loop state, so it never outlives a single
+        agent node execution. Concurrent identical calls wait for the first
+        one instead of calling the LLM themselves; failures are not cached.
+
+        Args:
+            input_data: Stage input model sent to the LLM
+            response_model: Expected response model
+            resolve: Performs the LLM call on a cache miss
+
+        Returns:
+            The resolved response model
+        """
+        payload = f"{response_model.__name__}\n{input_data.model_dump_json()}"
+        key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+        with self._lock:
+            future = self._llm_cache.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._llm_cache[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(resolve())
+            except BaseException as e:
+                with self._lock:
+                    del self._llm_cache[key]
+                future.set_exception(e)
+                raise
+
+        return future.result()
+
+    @staticmethod
+    def tool_result_key(tool_name: str, tool_args: Dict[str, Any]) -> str:
+        """Content hash identifying a tool call by name and arguments."""
+        payload = f"{tool_name}:{json.dumps(tool_args, sort_keys=True, default=str)}"
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
 
     def can_retry(self) -> bool:
-        """Check if we can still retry."""
-        return self.retry_count < self.max_retries
+        """Check if we can still retry (and the loop was not aborted)."""
+        return not self.abort and self.retry_count < self.max_retries
 
     def get_execution_state(self) -> str:
         """
@@ -116,42 +288,56 @@ class AgentLoopState(BaseModel):
         - 'tool_response': Has successful tool responses
         - 'tool_error': Has tool errors
         - 'retry': Has system errors (e.g., invalid tool name)
-        """
-        if not self.conversation_history:
-            return "initial"
-
-        last_entry = self.conversation_history[-1]
-        role = last_entry.get("role", "")
 
-        if role == "tool_error":
-            return "tool_error"
-        elif role == "system_error":
-            return "retry"
-        elif role == "tool":
-            return "tool_response"
-
-        return "initial"
+        Maintained by the add_* mutators, so this is a plain attribute read.
+        """
+        return self._execution_state
 
     def get_context_for_llm(self) -> str:
         """
         Format the conversation history for inclusion in LLM prompts.
+
+        Only the last `context_window` entries are included, preceded by a
+        note on how many were left out, and long tool results are cut.
+        History is append-only during a loop, so formatted entries are
+        cached and only entries added since the last call are formatted.
         """
-        if not self.conversation_history:
+        history = self.conversation_history
+        count = len(history)
+        if not count:
             return ""
 
-        parts = []
-        for entry in self.conversation_history:
-            role = entry.get("role", "unknown")
-            content = entry.get("content", "")
-            tool_name = entry.get("tool_name", "")
-
-            if role == "tool":
-                parts.append(f"[Tool: {tool_name}]\n{content}")
-            elif role == "tool_error":
-                parts.append(f"[Tool Error: {tool_name}]\n{content}")
-            elif role == "system_error":
-                parts.append(f"[System Error]\n{content}")
-            else:
-                parts.append(content)
-
-        return "\n\n".join(parts)
+        formatted = self._formatted_entries
+        if self._formatted_source is not history or len(formatted) > count:
+            formatted = self._formatted_entries = []
+            self._formatted_source = history
+        elif len(formatted) == count and self._formatted_text is not None:
+            return self._formatted_text
+
+        formatted.extend(_format_history_entry(entry) for entry in history[len(formatted):count])
+
+        omitted = count - self.context_window
+        if omitted > 0:
+            parts = [f"[{omitted} earlier entries omitted]", *formatted[omitted:]]
+        else:
+            parts = formatted
+
+        self._formatted_text = "\n\n".join(parts)
+        return self._formatted_text
+
+
+def _format_history_entry(entry: Dict[str, str]) -> str:
+    """Format a single conversation history entry for an LLM prompt."""
+    role = entry.get("role", "unknown")
+    content = entry.get("content", "")
+    tool_name = entry.get("tool_name", "")
+
+    if role == "tool":
+        if len(content) > MAX_TOOL_RESULT_CHARS:
+            content = content[:MAX_TOOL_RESULT_CHARS] + TRUNCATION_MARKER
+        return f"[Tool: {tool_name}]\n{content}"
+    if role == "tool_error":
+        return f"[Tool Error: {tool_name}]\n{content}"
+    if role == "system_error":
+        return f"[System Error]\n{content}"
+    return content
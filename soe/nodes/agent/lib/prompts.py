@@ -4,19 +4,15 @@ Agent node prompt building utilities
 Provides state-specific instructions for the agent's router stage.
 """
 
+from typing import Dict
 
-def get_state_instructions(execution_state: str) -> str:
-    """
-    Get state-specific instructions for the router stage.
-
-    The router decides between 'call_tool' and 'finish' actions.
-    Instructions vary based on what happened in previous iterations.
-    """
 
-    base_decision = "Decide the next action: 'call_tool' to use a tool, or 'finish' if task is complete."
+_BASE_DECISION = "Decide the next action: 'call_tool' to use a tool, or 'finish' if task is complete."
 
-    if execution_state == "initial":
-        return f"""{base_decision}
+# Instructions are a pure function of the execution state, so they are
+# built once at import time
+_STATE_INSTRUCTIONS: Dict[str, str] = {
+    "initial": f"""{_BASE_DECISION}
 
 INITIAL EXECUTION:
 1. Analyze the task and available context
@@ -24,10 +20,9 @@ INITIAL EXECUTION:
 3. If tools are needed, choose 'call_tool' and specify which tool
 4. If you have enough information to complete the task, choose 'finish'
 
-IMPORTANT: Only call tools that are NECESSARY. Be selective."""
+IMPORTANT: Only call tools that are NECESSARY. Be selective.""",
 
-    elif execution_state == "tool_response":
-        return f"""{base_decision}
+    "tool_response": f"""{_BASE_DECISION}
 
 TOOL RESPONSE RECEIVED:
 Your previous tool call was successful. Review the results in conversation history.
@@ -37,10 +32,9 @@ NEXT STEPS:
 2. If more information is needed, call another tool
 3. If task can now be completed, choose 'finish'
 
-Do NOT re-call tools that already succeeded."""
+Do NOT re-call tools that already succeeded.""",
 
-    elif execution_state == "tool_error":
-        return f"""{base_decision}
+    "tool_error": f"""{_BASE_DECISION}
 
 TOOL ERROR OCCURRED:
 Your previous tool call failed. Review the error in conversation history.
@@ -49,10 +43,9 @@ RECOVERY:
 1. Understand what went wrong
 2. Fix parameters and retry the failed tool, OR
 3. Try a different approach with another tool
-4. If task can be completed despite the error, choose 'finish'"""
+4. If task can be completed despite the error, choose 'finish'""",
 
-    elif execution_state == "retry":
-        return f"""{base_decision}
+    "retry": f"""{_BASE_DECISION}
 
 RETRY NEEDED:
 A system error occurred (e.g., invalid tool name). Review the error.
@@ -60,6 +53,15 @@ A system error occurred (e.g., invalid tool name). Review the error.
 RECOVERY:
 1. Check that tool names match available tools exactly
 2. Use a valid tool name and try again
-3. If no tools are needed, choose 'finish'"""
+3. If no tools are needed, choose 'finish'""",
+}
+
 
-    return base_decision
+def get_state_instructions(execution_state: str) -> str:
+    """
+    Get state-specific instructions for the router stage.
+
+    The router decides between 'call_tool' and 'finish' actions.
+    Instructions vary based on what happened in previous iterations.
+    """
+    return _STATE_INSTRUCTIONS.get(execution_state, _BASE_DECISION)
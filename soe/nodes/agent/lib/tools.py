@@ -2,34 +2,68 @@
 Agent node tool loading utilities.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple, Callable
 
 from ...lib.tools import get_tool_signature, get_tool_from_registry
 
 
-def load_tools_and_build_signatures(
-    tool_names: List[str],
+SignaturesLoader = Callable[[List[str], str, Any], str]
+
+
+def create_signatures_loader(
     tools_registry: Dict[str, Dict[str, Any]],
-    execution_id: str,
-    backends,
-) -> str:
-    """Load tools and build signature string for agent prompt.
+) -> SignaturesLoader:
+    """Create a signature loader specialized for a fixed tools registry.
+
+    Signatures for registered tools are built once, when the agent node
+    caller is created. Builtin tools are loaded into the registry and
+    added on first use. The joined signature string is memoized per
+    tool_names sequence, so repeated executions of the same agent node
+    reduce to a single dict lookup.
 
     Args:
-        tool_names: List of tool names to load
         tools_registry: Dict mapping tool name -> {function: callable, max_retries: int}
-        execution_id: Current workflow execution ID
-        backends: Backend services
 
     Returns:
-        Formatted string with all tool signatures for the prompt
+        Function (tool_names, execution_id, backends) -> formatted signature string
     """
-    tools_info = []
+    signature_by_tool: Dict[str, str] = {
+        name: get_tool_signature(tool_config["function"])
+        for name, tool_config in tools_registry.items()
+    }
+    signatures_by_names: Dict[Tuple[str, ...], str] = {}
+
+    def load_tools_and_build_signatures(
+        tool_names: List[str],
+        execution_id: str,
+        backends,
+    ) -> str:
+        """Load tools and build signature string for agent prompt.
+
+        Args:
+            tool_names: List of tool names to load
+            execution_id: Current workflow execution ID
+            backends: Backend services
+
+        Returns:
+            Formatted string with all tool signatures for the prompt
+        """
+        key = tuple(tool_names)
+        signatures = signatures_by_names.get(key)
+        if signatures is not None:
+            return signatures
+
+        tools_info = []
+        for tool_name in tool_names:
+            if tool_name not in signature_by_tool:
+                tool_entry = get_tool_from_registry(
+                    tool_name, tools_registry, execution_id, backends
+                )
+                signature_by_tool[tool_name] = get_tool_signature(tool_entry.function)
+            tools_info.append(signature_by_tool[tool_name])
 
-    for tool_name in tool_names:
-        tool_func, _, _, _ = get_tool_from_registry(
-            tool_name, tools_registry, execution_id, backends
-        )
-        tools_info.append(get_tool_signature(tool_func))
+        signatures = "\n\n".join(tools_info) if tools_info else ""
+        signatures_by_names[key] = signatures
+        return signatures
 
-    return "\n\n".join(tools_info) if tools_info else ""
+    return load_tools_and_build_signatures
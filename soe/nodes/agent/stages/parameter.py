@@ -1,4 +1,4 @@
-from typing import Type, TypeVar, TYPE_CHECKING
+from typing import Optional, Type, TypeVar, TYPE_CHECKING
 from pydantic import BaseModel
 from ...lib.llm_resolver import resolve_llm_call
 from ..types import ParameterInput
@@ -19,19 +19,31 @@ def execute_parameter_stage(
     tool_schema: Type[T],
     config: dict,
     max_retries: int = 3,
+    conversation_history: Optional[str] = None,
 ) -> T:
-    """Execute the Parameter Generation stage to generate arguments for a tool."""
+    """Execute the Parameter Generation stage to generate arguments for a tool.
+
+    conversation_history overrides the loop state's current history, so
+    parallel calls can share a snapshot taken before dispatch.
+    """
+    if conversation_history is None:
+        conversation_history = loop_state.get_context_for_llm()
+
     input_data = ParameterInput(
         task_description=agent_context.agent_prompt,
         context=agent_context.context_string,
         tool_name=tool_name,
-        conversation_history=loop_state.get_context_for_llm(),
+        conversation_history=conversation_history,
     )
 
-    return resolve_llm_call(
-        call_llm=call_llm,
-        input_data=input_data,
-        config=config,
-        response_model=tool_schema,
-        max_retries=max_retries,
+    return loop_state.resolve_llm_call_once(
+        input_data,
+        tool_schema,
+        lambda: resolve_llm_call(
+            call_llm=call_llm,
+            input_data=input_data,
+            config=config,
+            response_model=tool_schema,
+            max_retries=max_retries,
+        ),
     )
@@ -3,8 +3,7 @@ from pydantic import BaseModel, Field
 from ...lib.llm_resolver import resolve_llm_call
 from ...lib.response_builder import (
     build_response_model,
-    extract_output_from_response,
-    extract_signals_from_response,
+    extract_output_and_signals,
 )
 from ....types import CallLlm
 from ..types import ResponseStageInput, FinalResponse
@@ -37,16 +36,19 @@ def execute_response_stage(
         signal_options=signal_options,
     )
 
-    raw_response = resolve_llm_call(
-        call_llm=call_llm,
-        input_data=input_data,
-        config=config,
-        response_model=response_model,
-        max_retries=max_retries,
+    raw_response = loop_state.resolve_llm_call_once(
+        input_data,
+        response_model,
+        lambda: resolve_llm_call(
+            call_llm=call_llm,
+            input_data=input_data,
+            config=config,
+            response_model=response_model,
+            max_retries=max_retries,
+        ),
     )
 
-    output_value = extract_output_from_response(raw_response, output_field)
-    selected_signals = extract_signals_from_response(raw_response)
+    output_value, selected_signals = extract_output_and_signals(raw_response, output_field)
 
     return FinalResponse(
         output=output_value,
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple, Type, TYPE_CHECKING
+from pydantic import Field, create_model
 from ...lib.llm_resolver import resolve_llm_call
 from ..lib.prompts import get_state_instructions
 from ..types import RouterInput, RouterResponse
@@ -9,6 +11,35 @@ if TYPE_CHECKING:
     from ..lib.loop_state import AgentLoopState
 
 
+@lru_cache(maxsize=32)
+def _router_response_model(tool_names: Tuple[str, ...]) -> Type[RouterResponse]:
+    """Specialize RouterResponse so tool names must be one of tool_names.
+
+    The allowed names appear as an enum in the schema shown to the LLM,
+    and an unknown name fails validation, so it is retried inside the
+    LLM call instead of costing a full router iteration.
+    """
+    if not tool_names:
+        return RouterResponse
+
+    tool_name_type = Literal[tool_names]  # type: ignore[valid-type]
+    return create_model(
+        "RouterResponse",
+        __base__=RouterResponse,
+        tool_name=(
+            Optional[tool_name_type],
+            Field(None, description="Name of the tool to call. Required if action is 'call_tool'."),
+        ),
+        tool_names=(
+            List[tool_name_type],
+            Field(
+                default_factory=list,
+                description="Optional. Names of several independent tools to call in parallel, instead of tool_name.",
+            ),
+        ),
+    )
+
+
 def execute_router_stage(
     call_llm: CallLlm,
     agent_context: "AgentContext",
@@ -28,10 +59,16 @@ def execute_router_stage(
         conversation_history=loop_state.get_context_for_llm(),
     )
 
-    return resolve_llm_call(
-        call_llm=call_llm,
-        input_data=input_data,
-        config=config,
-        response_model=RouterResponse,
-        max_retries=max_retries,
+    response_model = _router_response_model(tuple(agent_context.tool_names))
+
+    return loop_state.resolve_llm_call_once(
+        input_data,
+        response_model,
+        lambda: resolve_llm_call(
+            call_llm=call_llm,
+            input_data=input_data,
+            config=config,
+            response_model=response_model,
+            max_retries=max_retries,
+        ),
     )
@@ -6,6 +6,7 @@ from pydantic import BaseModel, ConfigDict
 from ...types import Backends
 from ..lib.conversation_history import get_conversation_history
 from ...lib.jinja_render import render_prompt, get_context_for_prompt
+from .lib.loop_state import DEFAULT_CONTEXT_WINDOW
 
 
 class AgentOperationalState(BaseModel):
@@ -19,6 +20,7 @@ class AgentOperationalState(BaseModel):
     output_field: Optional[str]
     event_emissions: List[Dict[str, Any]]
     max_retries: int
+    context_window: int
     tools: List[str]
     llm_failure_signal: Optional[str]
     current_workflow_name: str
@@ -27,7 +29,7 @@ class AgentOperationalState(BaseModel):
 
 
 class AgentContext(BaseModel):
-    """Context data prepared for each agent loop iteration."""
+    """Context data prepared once per agent execution and shared by every loop iteration."""
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     context: Dict[str, Any]
@@ -45,14 +47,16 @@ def get_operational_state(
     execution_id: str,
     node_config: Dict[str, Any],
     backends: Backends,
+    context: Optional[Dict[str, Any]] = None,
 ) -> AgentOperationalState:
     """Retrieve all state needed for agent node execution."""
-    context = backends.context.get_context(execution_id)
+    if context is None:
+        context = backends.context.get_context(execution_id)
     operational = context["__operational__"]
     identity = node_config.get("identity")
     current_workflow_name = backends.workflow.get_current_workflow_name(execution_id)
     history_key, conversation_history = get_conversation_history(
-        execution_id, identity, backends
+        execution_id, identity, backends, context
     )
 
     return AgentOperationalState(
@@ -63,6 +67,7 @@ def get_operational_state(
         output_field=node_config.get("output_field"),
         event_emissions=node_config.get("event_emissions", []),
         max_retries=node_config.get("retries", 3),
+        context_window=node_config.get("context_window", DEFAULT_CONTEXT_WINDOW),
         tools=node_config.get("tools", []),
         llm_failure_signal=node_config.get("llm_failure_signal"),
         current_workflow_name=current_workflow_name,
@@ -75,33 +80,37 @@ def prepare_agent_context(
     execution_id: str,
     node_config: Dict[str, Any],
     backends,
-    tool_responses: Dict[str, Any],
+    has_tool_errors: bool,
+    operational_state: Optional[AgentOperationalState] = None,
 ) -> AgentContext:
-    """Prepare all context data for agent execution."""
-    context = backends.context.get_context(execution_id)
+    """Prepare all context data for agent execution.
+
+    When the operational state for this execution is given, its context
+    and workflow name are reused instead of being read from the backends
+    again.
+    """
+    if operational_state is not None:
+        context = operational_state.context
+        workflow_name = operational_state.current_workflow_name
+    else:
+        context = backends.context.get_context(execution_id)
+        workflow_name = backends.workflow.get_current_workflow_name(execution_id)
     workflows_registry = backends.workflow.get_workflows_registry(execution_id)
-    workflow_name = backends.workflow.get_current_workflow_name(execution_id)
 
     prompt_template = node_config["prompt"]
-    rendered_prompt, _ = render_prompt(prompt_template, context)
+    filtered_context, prompt_warnings = get_context_for_prompt(context, prompt_template)
+    rendered_prompt, _ = render_prompt(prompt_template, context, prompt_warnings)
 
-    filtered_context, _ = get_context_for_prompt(context, prompt_template)
-
-    has_errors = (
-        any("Error:" in str(v) for v in tool_responses.values())
-        if tool_responses
-        else False
-    )
     error_note = (
         "\n⚠️  Previous tool calls had errors. Please fix the parameters and try again."
-        if has_errors
+        if has_tool_errors
         else ""
     )
 
     return AgentContext(
         context=context,
         filtered_context=filtered_context,
-        context_string=json.dumps(filtered_context, indent=2),
+        context_string=json.dumps(filtered_context, separators=(",", ":")),
         workflows_registry=workflows_registry,
         workflow_name=workflow_name,
         error_note=error_note,
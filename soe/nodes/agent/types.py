@@ -30,34 +30,45 @@ class AgentResponse(BaseModel):
     clarification_message: str = ""
 
 
-class RouterInput(BaseModel):
-    """Input model for the Router stage prompt."""
-    instructions: str = Field(description="State-specific instructions for the router")
+class StageInput(BaseModel):
+    """Fields shared by every agent stage prompt.
+
+    Declared first, so each stage's serialized prompt starts with the same
+    bytes within a loop iteration and LLM providers with prompt-prefix
+    caching can reuse it across the router, parameter and response calls.
+    """
     task_description: str
     context: str
-    available_tools: str
     conversation_history: str = ""
 
 
+class RouterInput(StageInput):
+    """Input model for the Router stage prompt."""
+    instructions: str = Field(description="State-specific instructions for the router")
+    available_tools: str
+
+
 class RouterResponse(BaseModel):
     """Output model for the Router stage."""
     action: Literal["call_tool", "finish"]
     tool_name: Optional[str] = Field(None, description="Name of the tool to call. Required if action is 'call_tool'.")
+    tool_names: List[str] = Field(
+        default_factory=list,
+        description="Optional. Names of several independent tools to call in parallel, instead of tool_name.",
+    )
+    tool_args: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Optional. Arguments for tool_name, matching its signature. Omit if unsure; they will be requested separately.",
+    )
 
 
-class ParameterInput(BaseModel):
+class ParameterInput(StageInput):
     """Input for Parameter stage prompt."""
-    task_description: str
-    context: str
     tool_name: str
-    conversation_history: str = ""
 
 
-class ResponseStageInput(BaseModel):
+class ResponseStageInput(StageInput):
     """Input model for the Response stage prompt."""
-    task_description: str
-    context: str
-    conversation_history: str = ""
 
 
 class FinalResponse(BaseModel):
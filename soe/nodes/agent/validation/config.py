@@ -1,17 +1,19 @@
 """
 Agent node configuration validation.
 
-Called once at orchestration start, not during node execution.
+Runs at orchestration start and again when the node executes; configs
+that already passed are remembered (see lib/config_cache.py).
 """
 
 from typing import Dict, Any, List
+from ....lib.config_cache import remember_valid_configs
 from ....types import WorkflowValidationError
 
 
+@remember_valid_configs
 def validate_node_config(node_config: Dict[str, Any]) -> None:
     """
     Validate agent node configuration exhaustively.
-    Called once at orchestration start, not during node execution.
 
     Raises:
         WorkflowValidationError: If configuration is invalid
@@ -55,6 +57,13 @@ def validate_node_config(node_config: Dict[str, Any]) -> None:
                 "'retries' must be a positive integer (default is 3)"
             )
 
+    context_window = node_config.get("context_window")
+    if context_window is not None:
+        if isinstance(context_window, bool) or not isinstance(context_window, int) or context_window < 1:
+            raise WorkflowValidationError(
+                "'context_window' must be a positive integer (default is 10)"
+            )
+
     event_emissions = node_config.get("event_emissions")
     if event_emissions is not None:
         if not isinstance(event_emissions, list):
@@ -2,15 +2,19 @@
 Child node factory
 """
 
-import copy
+import contextvars
+import pickle
+import threading
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
 from ...validation.operational import validate_operational
 from .validation import validate_node_config
-from .state import get_operational_state
+from .state import ChildOperationalState, get_operational_state
 from ...lib.register_event import register_event
-from ...types import ChildNodeCaller, OrchestrateCaller, EventTypes
+from ...types import Backends, ChildNodeCaller, OrchestrateCaller, EventTypes
+from ..lib.context import fast_clone
 
 
 def create_child_node_caller(
@@ -20,10 +24,10 @@ def create_child_node_caller(
     """Create child node caller with pre-loaded dependencies."""
 
     def execute_child_node(id: str, node_config: Dict[str, Any]) -> None:
-        validate_operational(id, backends)
+        context = validate_operational(id, backends)
         validate_node_config(node_config)
 
-        state = get_operational_state(id, node_config, backends)
+        state = get_operational_state(id, node_config, backends, context)
 
         register_event(
             backends, id, EventTypes.NODE_EXECUTION,
@@ -35,20 +39,7 @@ def create_child_node_caller(
         )
 
         if state.fan_out_items and state.child_input_field:
-            for i, item in enumerate(state.fan_out_items):
-                child_context = copy.deepcopy(state.child_initial_context)
-                child_context[state.child_input_field] = item
-
-                if i > 0 and state.spawn_interval > 0:
-                    time.sleep(state.spawn_interval)
-
-                orchestrate_caller(
-                    config=state.workflows_registry,
-                    initial_workflow_name=state.child_workflow_name,
-                    initial_signals=state.child_initial_signals,
-                    initial_context=child_context,
-                    backends=backends,
-                )
+            _fan_out(state, orchestrate_caller, backends)
         else:
             orchestrate_caller(
                 config=state.workflows_registry,
@@ -59,3 +50,82 @@ def create_child_node_caller(
             )
 
     return execute_child_node
+
+
+def _fan_out(
+    state: ChildOperationalState,
+    orchestrate_caller: OrchestrateCaller,
+    backends: Backends,
+) -> None:
+    """
+    Start one child workflow per fan-out item.
+
+    Up to max_concurrency children run at once; spawn_interval spaces out
+    their starts. After a child fails no new children are started, and the
+    first failure in item order is raised once running children finish.
+    """
+    snapshot = _snapshot_context(state.child_initial_context)
+
+    def spawn(item: Any) -> None:
+        if snapshot is not None:
+            child_context = pickle.loads(snapshot)
+        else:
+            child_context = fast_clone(state.child_initial_context)
+        child_context[state.child_input_field] = item
+
+        orchestrate_caller(
+            config=state.workflows_registry,
+            initial_workflow_name=state.child_workflow_name,
+            initial_signals=state.child_initial_signals,
+            initial_context=child_context,
+            backends=backends,
+        )
+
+    if state.max_concurrency <= 1:
+        for i, item in enumerate(state.fan_out_items):
+            if i > 0 and state.spawn_interval > 0:
+                time.sleep(state.spawn_interval)
+            spawn(item)
+        return
+
+    failed = threading.Event()
+
+    def run(item: Any) -> None:
+        try:
+            spawn(item)
+        except BaseException:
+            failed.set()
+            raise
+
+    # The executor hands work over through a C-level queue.SimpleQueue, which
+    # costs far less per item than a child orchestration; no custom queue needed
+    with ThreadPoolExecutor(max_workers=state.max_concurrency) as executor:
+        futures = []
+        for i, item in enumerate(state.fan_out_items):
+            if i > 0 and state.spawn_interval > 0:
+                time.sleep(state.spawn_interval)
+            if failed.is_set():
+                break
+            # Each child runs in its own copy of the caller's contextvars
+            futures.append(executor.submit(contextvars.copy_context().run, run, item))
+
+        if failed.is_set():
+            for future in futures:
+                future.cancel()
+
+    for future in futures:
+        if not future.cancelled():
+            future.result()
+
+
+def _snapshot_context(context: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Serialize the shared child context once so each child unpickles its own copy.
+
+    Unpickling runs in C and is cheaper than a Python-level deep copy. Returns
+    None when the context holds values that cannot be pickled.
+    """
+    try:
+        return pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
@@ -1,17 +1,19 @@
 """Child node state retrieval."""
 
-import copy
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from ...types import Backends
 from ...lib.context_fields import get_accumulated
 from ...lib.child_context import prepare_child_context
 
 
-class ChildOperationalState(BaseModel):
-    """All data needed for child node execution."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+class ChildOperationalState(NamedTuple):
+    """
+    All data needed for child node execution.
+
+    Built from already-trusted internal data on every child node execution,
+    so it is a NamedTuple rather than a validated pydantic model.
+    """
 
     context: Dict[str, Any]
     main_execution_id: str
@@ -19,18 +21,21 @@ class ChildOperationalState(BaseModel):
     child_initial_signals: List[str]
     child_initial_context: Dict[str, Any]
     workflows_registry: Dict[str, Any]
-    fan_out_items: List[Any] = Field(default_factory=list)
+    fan_out_items: List[Any]
     child_input_field: Optional[str] = None
     spawn_interval: float = 0.0
+    max_concurrency: int = 1
 
 
 def get_operational_state(
     execution_id: str,
     node_config: Dict[str, Any],
     backends: Backends,
+    context: Optional[Dict[str, Any]] = None,
 ) -> ChildOperationalState:
     """Retrieve all state needed for child node execution."""
-    context = backends.context.get_context(execution_id)
+    if context is None:
+        context = backends.context.get_context(execution_id)
     operational = context["__operational__"]
     main_execution_id = operational["main_execution_id"]
 
@@ -41,7 +46,9 @@ def get_operational_state(
         main_execution_id=main_execution_id,
     )
 
-    workflows_registry = copy.deepcopy(backends.workflow.get_workflows_registry(execution_id))
+    # Backends hand out a fresh copy per read, and the child orchestrate
+    # caller copies it again before parsing
+    workflows_registry = backends.workflow.get_workflows_registry(execution_id)
 
     fan_out_field = node_config.get("fan_out_field")
     fan_out_items = get_accumulated(context, fan_out_field) if fan_out_field else []
@@ -56,4 +63,5 @@ def get_operational_state(
         fan_out_items=fan_out_items,
         child_input_field=node_config.get("child_input_field"),
         spawn_interval=node_config.get("spawn_interval", 0.0),
+        max_concurrency=node_config.get("max_concurrency", 1),
     )
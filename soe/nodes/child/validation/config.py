@@ -1,17 +1,19 @@
 """
 Child node configuration validation.
 
-Called once at orchestration start, not during node execution.
+Runs at orchestration start and again when the node executes; configs
+that already passed are remembered (see lib/config_cache.py).
 """
 
 from typing import Dict, Any
+from ....lib.config_cache import remember_valid_configs
 from ....types import WorkflowValidationError
 
 
+@remember_valid_configs
 def validate_node_config(node_config: Dict[str, Any]) -> None:
     """
     Validate sub-orchestration node configuration exhaustively.
-    Called once at orchestration start, not during node execution.
 
     Raises:
         WorkflowValidationError: If configuration is invalid
@@ -52,11 +54,11 @@ def validate_node_config(node_config: Dict[str, Any]) -> None:
             raise WorkflowValidationError(
                 "'signals_to_parent' must be a list of signal names that should propagate from child to parent"
             )
-        for signal in signals_to_parent:
-            if not isinstance(signal, str):
-                raise WorkflowValidationError(
-                    f"All items in 'signals_to_parent' must be strings. Found: {type(signal).__name__}"
-                )
+        if not all(isinstance(signal, str) for signal in signals_to_parent):
+            bad = next(signal for signal in signals_to_parent if not isinstance(signal, str))
+            raise WorkflowValidationError(
+                f"All items in 'signals_to_parent' must be strings. Found: {type(bad).__name__}"
+            )
 
     context_updates_to_parent = node_config.get("context_updates_to_parent")
     if context_updates_to_parent is not None:
@@ -64,11 +66,11 @@ def validate_node_config(node_config: Dict[str, Any]) -> None:
             raise WorkflowValidationError(
                 "'context_updates_to_parent' must be a list of context key names that should propagate from child to parent"
             )
-        for key in context_updates_to_parent:
-            if not isinstance(key, str):
-                raise WorkflowValidationError(
-                    f"All items in 'context_updates_to_parent' must be strings. Found: {type(key).__name__}"
-                )
+        if not all(isinstance(key, str) for key in context_updates_to_parent):
+            bad = next(key for key in context_updates_to_parent if not isinstance(key, str))
+            raise WorkflowValidationError(
+                f"All items in 'context_updates_to_parent' must be strings. Found: {type(bad).__name__}"
+            )
 
     input_fields = node_config.get("input_fields")
     if input_fields is not None and not isinstance(input_fields, list):
@@ -104,6 +106,13 @@ def validate_node_config(node_config: Dict[str, Any]) -> None:
                 "'spawn_interval' must be non-negative"
             )
 
+    max_concurrency = node_config.get("max_concurrency")
+    if max_concurrency is not None:
+        if not isinstance(max_concurrency, int) or isinstance(max_concurrency, bool) or max_concurrency < 1:
+            raise WorkflowValidationError(
+                "'max_concurrency' must be a positive integer (fan-out children running at once, default 1)"
+            )
+
     event_emissions = node_config.get("event_emissions")
     if event_emissions is not None:
         if not isinstance(event_emissions, list):
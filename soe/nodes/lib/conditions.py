@@ -5,29 +5,16 @@ Used by Router, LLM, Agent, and Tool nodes.
 
 import re
 from typing import Dict, List, Any
-from jinja2 import Environment
 
+from ...lib.jinja_render import HISTORY_INDEX_VAR, HistoryIndex, compile_template
 
-def _create_accumulated_filter(full_context: Dict[str, Any]):
-    """Create an accumulated filter that returns full history for a field."""
-    def accumulated_filter(value):
-        """
-        Return the full accumulated history list for a context field.
 
-        If history has exactly one entry and it's a list, returns that list
-        (common case: initial context passed a list as value).
-        Otherwise returns the history entries.
-        """
-        for key, hist_list in full_context.items():
-            if key.startswith("__"):
-                continue
-            if isinstance(hist_list, list) and hist_list and hist_list[-1] == value:
-                if len(hist_list) == 1 and isinstance(hist_list[0], list):
-                    return hist_list[0]
-                return hist_list
-        return [value] if value is not None else []
+_TEMPLATE_PATTERN = re.compile(r"\{\{.*\}\}")
+_FALSE_RESULTS = frozenset({"false", "0", "none", ""})
 
-    return accumulated_filter
+
+def _is_templated(condition: str) -> bool:
+    return bool(condition) and _TEMPLATE_PATTERN.search(condition) is not None
 
 
 def evaluate_conditions(
@@ -46,10 +33,11 @@ def evaluate_conditions(
     Returns:
         List of signal names that passed their conditions (or had no condition)
     """
-    jinja_env = Environment()
+    if not any(_is_templated(emission.get("condition", "")) for emission in event_emissions):
+        return [emission.get("signal_name") for emission in event_emissions]
 
     if full_context:
-        jinja_env.filters["accumulated"] = _create_accumulated_filter(full_context)
+        render_context = {**render_context, HISTORY_INDEX_VAR: HistoryIndex(full_context)}
 
     filtered_signals = []
 
@@ -57,13 +45,13 @@ def evaluate_conditions(
         signal_name = emission.get("signal_name")
         condition = emission.get("condition", "")
 
-        if not condition or not re.search(r"\{\{.*\}\}", condition):
+        if not _is_templated(condition):
             filtered_signals.append(signal_name)
             continue
 
         try:
-            result = jinja_env.from_string(condition).render(**render_context)
-            if result and result.strip().lower() not in ["false", "0", "none", ""]:
+            result = compile_template(condition).render(**render_context)
+            if result and result.strip().lower() not in _FALSE_RESULTS:
                 filtered_signals.append(signal_name)
         except Exception:
             pass
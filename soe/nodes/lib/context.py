@@ -1,11 +1,31 @@
 """Context output utilities shared across nodes."""
 
-from typing import Any, Optional
+import copy
+from typing import Any, Dict, Optional
 from ...lib.parent_sync import sync_context_to_parent
 from ...lib.context_fields import set_field, get_field
 from ...types import Backends
 
-__all__ = ["set_field", "get_field", "save_output_to_context"]
+__all__ = ["set_field", "get_field", "save_output_to_context", "fast_clone"]
+
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def fast_clone(value: Any) -> Any:
+    """
+    Deep-copy JSON-shaped data (dicts, lists and scalars).
+
+    Skips copy.deepcopy's memo and reduce machinery, which dominates when
+    cloning plain context data. Any other type is handed to copy.deepcopy.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    if value_type is dict:
+        return {key: fast_clone(item) for key, item in value.items()}
+    if value_type is list:
+        return [fast_clone(item) for item in value]
+    return copy.deepcopy(value)
 
 
 def save_output_to_context(
@@ -13,12 +33,20 @@ def save_output_to_context(
     output_field: Optional[str],
     output_value: Any,
     backends: Backends,
-) -> None:
-    """Save output value to context and sync to parent if configured."""
+    context: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Save output value to context and sync to parent if configured.
+
+    Pass the context the node already loaded to skip fetching it again; it
+    is updated in place. Returns the saved context.
+    """
     if not output_field or output_value is None:
-        return
+        return context
 
-    context = backends.context.get_context(execution_id)
+    if context is None:
+        context = backends.context.get_context(execution_id)
     set_field(context, output_field, output_value)
     backends.context.save_context(execution_id, context)
     sync_context_to_parent(context, [output_field], backends)
+    return context
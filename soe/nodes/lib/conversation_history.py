@@ -7,12 +7,15 @@ for nodes that support identity-based conversation persistence.
 
 from typing import Dict, Any, List, Optional, Tuple
 from ...types import Backends
+from .identity import get_system_prompt_from_identity
+from ...lib.json_encode import dumps
 
 
 def get_conversation_history(
     execution_id: str,
     identity: Optional[str],
     backends: Backends,
+    context: Optional[Dict[str, Any]] = None,
 ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
     """
     Get conversation history and history key for a node with identity.
@@ -28,6 +31,7 @@ def get_conversation_history(
         execution_id: Current execution ID
         identity: Identity key for conversation history
         backends: Backend services
+        context: Execution context, if the caller already loaded it
 
     Returns:
         Tuple of (history_key, conversation_history list)
@@ -36,17 +40,16 @@ def get_conversation_history(
     if not identity or not backends.conversation_history:
         return (None, [])
 
-    context = backends.context.get_context(execution_id)
+    if context is None:
+        context = backends.context.get_context(execution_id)
     main_id = context.get("__operational__", {}).get("main_execution_id", execution_id)
     history = backends.conversation_history.get_conversation_history(main_id)
 
-    if not history and backends.identity:
-        identities = backends.identity.get_identities(main_id)
-        if identities and identity in identities:
-            system_prompt = identities[identity]
-            if system_prompt:
-                history = [{"role": "system", "content": system_prompt}]
-                backends.conversation_history.save_conversation_history(main_id, history)
+    if not history:
+        system_prompt = get_system_prompt_from_identity(identity, main_id, backends)
+        if system_prompt:
+            history = [{"role": "system", "content": system_prompt}]
+            backends.conversation_history.save_conversation_history(main_id, history)
 
     return (main_id, history)
 
@@ -55,23 +58,32 @@ def format_conversation_history(conversation_history: List[Dict[str, Any]]) -> s
     """Format conversation history as a string for prompts."""
     if not conversation_history:
         return ""
-    return "\n".join(
+    # A list comprehension: join() would materialize a generator first anyway
+    return "\n".join([
         f"[{msg.get('role', 'unknown')}]: {msg.get('content', '')}"
         for msg in conversation_history
-    )
+    ])
 
 
 def save_conversation_turn(
     history_key: Optional[str],
     conversation_history: List[Dict[str, Any]],
     user_content: str,
-    assistant_content: str,
+    assistant_content: Any,
     backends: Backends,
 ) -> None:
-    """Save a conversation turn (user + assistant) to history."""
+    """
+    Save a conversation turn (user + assistant) to history.
+
+    Structured assistant content is serialized to JSON, and only when the
+    turn is actually saved.
+    """
     if not history_key or not backends.conversation_history:
         return
 
+    if not isinstance(assistant_content, str):
+        assistant_content = dumps(assistant_content, default=str)
+
     conversation_history.append({"role": "user", "content": user_content})
-    conversation_history.append({"role": "assistant", "content": str(assistant_content)})
+    conversation_history.append({"role": "assistant", "content": assistant_content})
     backends.conversation_history.save_conversation_history(history_key, conversation_history)
@@ -13,7 +13,7 @@ Example:
     coding_expert: "You are an expert programmer."
 """
 
-from typing import Dict, Any, Optional
+from typing import Optional
 from ...types import Backends
 
 
@@ -26,7 +26,8 @@ def get_system_prompt_from_identity(
     Get the system prompt for an identity.
 
     Looks up the identity's system prompt from the identity backend using the
-    main_execution_id and identity key.
+    main_execution_id and identity key, via the backend's single-identity
+    lookup rather than fetching every identity.
 
     Args:
         identity: The identity key (e.g., "assistant", "coding_assistant")
@@ -39,14 +40,7 @@ def get_system_prompt_from_identity(
     if not identity or not backends.identity:
         return None
 
-    if hasattr(backends.identity, 'get_identity'):
-        return backends.identity.get_identity(main_execution_id, identity)
-
-    identities = backends.identity.get_identities(main_execution_id)
-    if not identities:
-        return None
-
-    return identities.get(identity)
+    return backends.identity.get_identity(main_execution_id, identity)
 
 
 def format_system_prompt_for_history(system_prompt: Optional[str]) -> str:
@@ -12,30 +12,46 @@ Used by LLM and Agent nodes.
 
 import json
 import re
-from typing import Type, Dict, Any, TypeVar
+from functools import lru_cache
+from typing import Type, Dict, Any, Iterable, NamedTuple, Tuple, TypeVar, Union
 from pydantic import BaseModel, ValidationError
+from ...lib.json_encode import dumps
 from ...types import CallLlm
 
 T = TypeVar("T", bound=BaseModel)
 
+# Bounded because output and router models can be created dynamically
+FORMAT_INSTRUCTIONS_CACHE_SIZE = 256
+
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*([\[\{].*?[\]\}])\s*```", re.DOTALL)
+_JSON_START_RE = re.compile(r"[\[{]")
+# Only quotes, escapes and brackets affect balancing; everything else is skipped in C
+_STRUCTURAL_CHAR_RE = re.compile(r'[\\"{}\[\]]')
+_JSON_DECODER = json.JSONDecoder()
+_STREAM_START_RE = re.compile(r"<think>|[\[{]")
+
 
 def resolve_llm_call(
     call_llm: CallLlm,
-    input_data: BaseModel,
+    input_data: Union[BaseModel, NamedTuple],
     config: Dict[str, Any],
     response_model: Type[T],
     max_retries: int = 3,
 ) -> T:
     """
     Execute the LLM call loop:
-    1. Convert input_data to JSON string
+    1. Convert input_data (a model or NamedTuple) to JSON string
     2. Augment with format instructions for response_model
-    3. Call LLM
+    3. Call LLM (a streamed response is read only until its JSON closes)
     4. Parse and Validate
     5. Retry on failure
     """
     try:
-        prompt_base = input_data.model_dump_json()
+        if isinstance(input_data, BaseModel):
+            prompt_base = input_data.model_dump_json()
+        else:
+            prompt_base = dumps(input_data._asdict())
     except Exception as e:
         raise ValueError(f"Failed to serialize input model: {e}")
 
@@ -50,6 +66,9 @@ def resolve_llm_call(
         except Exception as e:
             raise e
 
+        if not isinstance(response_text, str):
+            response_text = _read_stream(response_text)
+
         try:
             return _parse_response(response_text, response_model)
         except (ValidationError, ValueError) as e:
@@ -63,8 +82,9 @@ def resolve_llm_call(
     raise Exception(f"Max retries ({max_retries}) exceeded. Last error: {last_error}")
 
 
+@lru_cache(maxsize=FORMAT_INSTRUCTIONS_CACHE_SIZE)
 def _get_format_instructions(model: Type[BaseModel]) -> str:
-    """Generate instructions for JSON output based on the model schema."""
+    """Generate instructions for JSON output based on the model schema (memoized per class)."""
     schema = model.model_json_schema()
     return (
         f"Respond ONLY with a valid JSON object matching this schema:\n"
@@ -93,7 +113,7 @@ def _parse_response(text: str, model: Type[T]) -> T:
     Parse text response into a Pydantic model.
     Removes <think> tags and extracts JSON from markdown blocks if present.
     """
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
+    text = _THINK_RE.sub("", text)
     json_str = _extract_json(text)
     return model.model_validate_json(json_str)
 
@@ -102,41 +122,123 @@ def _extract_json(text: str) -> str:
     """Extract JSON from text, handling nested objects and arrays."""
     text = text.strip()
 
-    match = re.search(r"```(?:json)?\s*([\[\{].*?[\]\}])\s*```", text, re.DOTALL)
+    match = _JSON_BLOCK_RE.search(text)
     if match:
         return match.group(1)
 
-    for i, char in enumerate(text):
-        if char in "{[":
-            return _extract_balanced(text, i)
+    match = _JSON_START_RE.search(text)
+    if match:
+        return _extract_balanced(text, match.start())
     return text
 
 
 def _extract_balanced(text: str, start: int) -> str:
-    """Extract balanced JSON from start position."""
-    open_char = text[start]
-    close_char = "}" if open_char == "{" else "]"
-    depth = 0
-    in_string = False
-    escape = False
-
-    for i in range(start, len(text)):
-        c = text[i]
-        if escape:
-            escape = False
-            continue
-        if c == "\\":
-            escape = True
-            continue
-        if c == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if c == open_char:
-            depth += 1
-        elif c == close_char:
-            depth -= 1
-            if depth == 0:
-                return text[start:i + 1]
-    return text[start:]
+    """
+    Extract balanced JSON from start position.
+
+    Well-formed JSON is delimited by the C decoder in one call; malformed
+    text falls back to scanning the structural characters.
+    """
+    try:
+        _, end = _JSON_DECODER.raw_decode(text, start)
+        return text[start:end]
+    except ValueError:
+        pass
+
+    end = _BalancedScanner(text[start]).scan(text, start)
+    return text[start:end] if end >= 0 else text[start:]
+
+
+class _BalancedScanner:
+    """
+    Bracket-depth state machine over the structural characters of JSON.
+
+    State survives between scan() calls, so text can be fed incrementally
+    as long as each call sees the whole text so far.
+    """
+
+    __slots__ = ("open_char", "close_char", "depth", "in_string", "escaped_index")
+
+    def __init__(self, open_char: str):
+        self.open_char = open_char
+        self.close_char = "}" if open_char == "{" else "]"
+        self.depth = 0
+        self.in_string = False
+        self.escaped_index = -1
+
+    def scan(self, text: str, pos: int) -> int:
+        """Scan text from pos; return the index after the closing bracket, or -1."""
+        for match in _STRUCTURAL_CHAR_RE.finditer(text, pos):
+            i = match.start()
+            if i == self.escaped_index:
+                continue
+            c = match.group()
+            if c == "\\":
+                self.escaped_index = i + 1
+                continue
+            if c == '"':
+                self.in_string = not self.in_string
+                continue
+            if self.in_string:
+                continue
+            if c == self.open_char:
+                self.depth += 1
+            elif c == self.close_char:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+def _read_stream(chunks: Iterable[str]) -> str:
+    """
+    Read a streamed response until its first top-level JSON value closes.
+
+    Text inside <think> blocks is skipped while looking for the value. The
+    stream is closed once the value is complete, so generation can stop
+    early; if it never completes, everything read is returned.
+    """
+    iterator = iter(chunks)
+    text = ""
+    pos = 0
+    scanner = None
+
+    try:
+        for chunk in iterator:
+            text += chunk
+            if scanner is None:
+                pos, start = _find_stream_json_start(text, pos)
+                if start < 0:
+                    continue
+                scanner = _BalancedScanner(text[start])
+                pos = start
+            end = scanner.scan(text, pos)
+            if end >= 0:
+                return text[:end]
+            pos = len(text)
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+    return text
+
+
+def _find_stream_json_start(text: str, pos: int) -> Tuple[int, int]:
+    """
+    Find where the JSON value starts in streamed text read so far.
+
+    Returns (resume position, start index), with start -1 when more text is
+    needed, e.g. inside an unclosed <think> block.
+    """
+    while True:
+        match = _STREAM_START_RE.search(text, pos)
+        if match is None:
+            # Keep a partially received "<think>" tag in view
+            return max(pos, len(text) - len("<think>") + 1), -1
+        if match.group() != "<think>":
+            return match.start(), match.start()
+        close = text.find("</think>", match.end())
+        if close < 0:
+            return match.start(), -1
+        pos = close + len("</think>")
@@ -5,7 +5,7 @@ Shared LLM output utilities for LLM and Agent nodes.
 from typing import Dict, Any, List, Optional, Type
 from pydantic import BaseModel
 
-from .signals import has_jinja_conditions
+from .signals import get_signal_names, has_jinja_conditions
 from ...lib.schema_validation import schema_to_root_model
 from ...lib.register_event import register_event
 from ...types import EventTypes
@@ -18,8 +18,7 @@ def needs_llm_signal_selection(event_emissions: List[Dict[str, Any]]) -> bool:
     if has_jinja_conditions(event_emissions):
         return False
 
-    signal_count = sum(1 for e in event_emissions if e.get("signal_name"))
-    return signal_count > 1
+    return len(get_signal_names(event_emissions)) > 1
 
 
 def get_signal_options(event_emissions: List[Dict[str, Any]]) -> Optional[List[Dict[str, str]]]:
@@ -2,25 +2,62 @@
 Dynamic Pydantic response model builder.
 """
 
-from typing import Type, Any, Optional, List, Dict, Literal
-from pydantic import RootModel
-from pydantic import BaseModel, Field, create_model
+from functools import lru_cache
+from typing import Type, Any, Optional, List, Dict, Literal, Tuple
+from pydantic import BaseModel, Field, RootModel, create_model
+
+
+RESPONSE_MODEL_CACHE_SIZE = 512
+
+SignalKey = Tuple[Tuple[str, Optional[str]], ...]
+
+
+def get_signal_key(signal_options: Optional[List[Dict[str, str]]]) -> SignalKey:
+    """Hashable (name, description) fingerprint of signal options."""
+    return tuple((s["name"], s.get("description")) for s in signal_options or ())
 
 
 def build_response_model(
     output_field: Optional[str] = None,
     output_schema: Optional[Type[BaseModel]] = None,
     signal_options: Optional[List[Dict[str, str]]] = None,
+    signal_key: Optional[SignalKey] = None,
 ) -> Type[BaseModel]:
-    """Dynamically build a Pydantic response model based on requirements."""
-    fields: Dict[str, Any] = {}
+    """
+    Dynamically build a Pydantic response model based on requirements.
 
+    Models are cached on the output field, the output schema class and the
+    signal options, so repeat node executions reuse the built model. Callers
+    that already hold get_signal_key(signal_options) can pass it as
+    signal_key to skip deriving it again.
+    """
     root_schema = None
-    if output_schema and isinstance(output_schema, type) and issubclass(output_schema, RootModel):
+    if output_schema is not None and _is_root_model_cls(output_schema):
         # Use RootModel directly if no signal selection is needed (standard case for single output)
         if not signal_options or len(signal_options) <= 1:
             return output_schema
         root_schema = output_schema
+    elif not output_field and (not signal_options or len(signal_options) <= 1):
+        return _DEFAULT_RESPONSE_MODEL
+
+    if signal_key is None:
+        signal_key = get_signal_key(signal_options)
+    return _build_response_model_cached(output_field, root_schema, signal_key)
+
+
+@lru_cache(maxsize=RESPONSE_MODEL_CACHE_SIZE)
+def _is_root_model_cls(cls: Any) -> bool:
+    return isinstance(cls, type) and issubclass(cls, RootModel)
+
+
+@lru_cache(maxsize=RESPONSE_MODEL_CACHE_SIZE)
+def _build_response_model_cached(
+    output_field: Optional[str],
+    root_schema: Optional[Type[BaseModel]],
+    signal_key: SignalKey,
+) -> Type[BaseModel]:
+    fields: Dict[str, Any] = {}
+
     if output_field:
         if root_schema:
             root_type = root_schema.model_fields["root"].annotation
@@ -39,21 +76,10 @@ def build_response_model(
             Field(..., description="The final output/result")
         )
 
-    if signal_options and len(signal_options) > 1:
-        signal_names = [s["name"] for s in signal_options]
-        signal_literal = Literal[tuple(signal_names)]
-
-        descriptions = []
-        for s in signal_options:
-            if s.get("description"):
-                descriptions.append(f"- {s['name']}: {s['description']}")
-            else:
-                descriptions.append(f"- {s['name']}")
-
-        desc_text = "Select ALL signals that apply (can be none, one, or multiple):\n" + "\n".join(descriptions)
-
+    if len(signal_key) > 1:
+        signals_type, desc_text = _build_signal_field(signal_key)
         fields["selected_signals"] = (
-            List[signal_literal],
+            signals_type,
             Field(default=[], description=desc_text)
         )
 
@@ -64,30 +90,48 @@ def build_response_model(
     return create_model(model_name, **fields)
 
 
-def extract_output_from_response(
+@lru_cache(maxsize=RESPONSE_MODEL_CACHE_SIZE)
+def _build_signal_field(signal_key: SignalKey) -> Tuple[Any, str]:
+    """Type and description of the selected_signals field for a set of signals."""
+    signal_names = [name for name, _ in signal_key]
+    signal_literal = Literal[tuple(signal_names)]
+
+    descriptions = []
+    for name, description in signal_key:
+        if description:
+            descriptions.append(f"- {name}: {description}")
+        else:
+            descriptions.append(f"- {name}")
+
+    desc_text = "Select ALL signals that apply (can be none, one, or multiple):\n" + "\n".join(descriptions)
+    return List[signal_literal], desc_text
+
+
+# Plain-output shape of nodes without an output field or signal selection
+_DEFAULT_RESPONSE_MODEL = _build_response_model_cached(None, None, ())
+
+
+def extract_output_and_signals(
     response: BaseModel,
     output_field: Optional[str],
-) -> Any:
-    """Extract the output value from a dynamic response model."""
+) -> Tuple[Any, List[str]]:
+    """
+    Extract the output value and selected signals from a dynamic response model.
+
+    The response is serialized at most once. Signals are a list of names
+    (can be empty).
+    """
     if isinstance(response, RootModel):
         value = response.root
         if isinstance(value, BaseModel):
-            return value.model_dump()
-        return value
+            return value.model_dump(), []
+        return value, []
+
     data = response.model_dump()
     if output_field and output_field in data:
-        return data[output_field]
-    return data.get("output")
-
+        output = data[output_field]
+    else:
+        output = data.get("output")
 
-def extract_signals_from_response(response: BaseModel) -> List[str]:
-    """
-    Extract the selected signals from a dynamic response model.
-    Returns a list of signal names (can be empty).
-    """
-    data = response.model_dump()
-    if isinstance(data, dict):
-        signals = data.get("selected_signals", [])
-        if isinstance(signals, list):
-            return signals
-    return []
+    signals = data.get("selected_signals")
+    return output, signals if isinstance(signals, list) else []
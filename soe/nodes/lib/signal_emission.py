@@ -9,7 +9,7 @@ from typing import Dict, List, Any, Optional, Protocol
 
 from ...types import BroadcastSignalsCaller, Backends, EventTypes
 from ...lib.register_event import register_event
-from .signals import has_jinja_conditions, handle_signal_emission
+from .signals import evaluate_emission_conditions, get_signal_names, has_jinja_conditions
 
 
 class OperationalState(Protocol):
@@ -38,15 +38,13 @@ def handle_llm_failure(
         raise RuntimeError(error_message)
 
 
-def emit_completion_signals(
+def get_completion_signals(
     selected_signals: List[str],
     node_config: Dict[str, Any],
     operational_state: OperationalState,
-    broadcast_signals_caller: BroadcastSignalsCaller,
-    execution_id: str,
-) -> None:
+) -> List[str]:
     """
-    Emit signals after successful node completion.
+    Decide which signals to emit after successful node completion.
 
     Signal emission priority:
     1. LLM-selected signals (when multiple signals with plain-text conditions)
@@ -58,18 +56,31 @@ def emit_completion_signals(
     - Jinja template ({{ }}): evaluated to determine if signal should emit
     """
     if selected_signals:
-        broadcast_signals_caller(execution_id, selected_signals)
-    elif operational_state.event_emissions:
-        if has_jinja_conditions(operational_state.event_emissions):
-            handle_signal_emission(
-                [], node_config, operational_state.context,
-                broadcast_signals_caller, execution_id
-            )
-        else:
-            signals = [
-                e.get("signal_name") for e in operational_state.event_emissions
-                if e.get("signal_name")
-            ]
-            if len(signals) == 1:
-                broadcast_signals_caller(execution_id, signals)
-            # Multiple signals with no selection = LLM chose none, which is valid
+        return selected_signals
+    if not operational_state.event_emissions:
+        return []
+
+    if has_jinja_conditions(operational_state.event_emissions):
+        return evaluate_emission_conditions([], node_config, operational_state.context)
+
+    signals = get_signal_names(operational_state.event_emissions)
+    # Multiple signals with no selection = LLM chose none, which is valid
+    return signals if len(signals) == 1 else []
+
+
+def emit_completion_signals(
+    selected_signals: List[str],
+    node_config: Dict[str, Any],
+    operational_state: OperationalState,
+    broadcast_signals_caller: BroadcastSignalsCaller,
+    execution_id: str,
+) -> None:
+    """
+    Emit signals after successful node completion.
+
+    All signals chosen by get_completion_signals go out in a single
+    broadcast.
+    """
+    signals = get_completion_signals(selected_signals, node_config, operational_state)
+    if signals:
+        broadcast_signals_caller(execution_id, signals)
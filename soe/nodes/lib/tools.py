@@ -5,7 +5,8 @@ Used by Agent node and Tool node for introspection and registry lookup.
 """
 
 import inspect
-from typing import Dict, Any, Callable, Type, Optional, Union
+from functools import lru_cache
+from typing import Dict, Any, Callable, NamedTuple, Type, Optional, Union
 from pydantic import BaseModel, create_model
 
 from ...types import Backends
@@ -14,14 +15,20 @@ from ...builtin_tools import get_builtin_tool_factory
 
 DEFAULT_MAX_RETRIES = 0
 
+# Introspection results are pure functions of the callable, so they are
+# cached per function object. Builtin tools are new closures per execution,
+# hence a bound rather than an unbounded cache.
+TOOL_INTROSPECTION_CACHE_SIZE = 512
 
+
+@lru_cache(maxsize=TOOL_INTROSPECTION_CACHE_SIZE)
 def get_tool_signature(tool_func: Callable) -> str:
     """Extract function signature and docstring for prompt."""
     sig = inspect.signature(tool_func)
     params = []
     for name, param in sig.parameters.items():
         param_type = (
-            param.annotation if param.annotation != inspect.Parameter.empty else "Any"
+            param.annotation if param.annotation is not inspect.Parameter.empty else "Any"
         )
         params.append(f"{name}: {param_type}")
 
@@ -32,6 +39,7 @@ def get_tool_signature(tool_func: Callable) -> str:
     return f"{func_name}({params_str})\n  {doc}"
 
 
+@lru_cache(maxsize=TOOL_INTROSPECTION_CACHE_SIZE)
 def create_tool_schema(tool_func: Callable) -> Type[BaseModel]:
     """Dynamically create a Pydantic model from a function signature."""
     sig = inspect.signature(tool_func)
@@ -39,11 +47,11 @@ def create_tool_schema(tool_func: Callable) -> Type[BaseModel]:
 
     for name, param in sig.parameters.items():
         annotation = param.annotation
-        if annotation == inspect.Parameter.empty:
+        if annotation is inspect.Parameter.empty:
             annotation = Any
 
         default = param.default
-        if default == inspect.Parameter.empty:
+        if default is inspect.Parameter.empty:
             field_info = (annotation, ...)
         else:
             field_info = (annotation, default)
@@ -53,14 +61,22 @@ def create_tool_schema(tool_func: Callable) -> Type[BaseModel]:
     return create_model(f"{tool_func.__name__}Schema", **fields)
 
 
+class ToolEntry(NamedTuple):
+    """Normalized tool registry entry."""
+    function: Callable
+    max_retries: int = DEFAULT_MAX_RETRIES
+    failure_signal: Optional[str] = None
+    process_accumulated: bool = False
+
+
 def _normalize_registry_entry(
     entry: Union[Callable, Dict[str, Any]],
-) -> tuple[Callable, int, Optional[str], bool]:
+) -> ToolEntry:
     """Normalize a tool registry entry to extract function and configuration."""
     if callable(entry):
-        return entry, DEFAULT_MAX_RETRIES, None, False
+        return ToolEntry(entry)
 
-    return (
+    return ToolEntry(
         entry["function"],
         entry.get("max_retries", DEFAULT_MAX_RETRIES),
         entry.get("failure_signal"),
@@ -73,14 +89,14 @@ def get_tool_from_registry(
     tools_registry: Dict[str, Any],
     execution_id: str,
     backends: Backends,
-) -> tuple[Callable, int, Optional[str], bool]:
+) -> ToolEntry:
     """
     Get tool function from registry or builtin tools, normalizing the entry.
 
     Caches builtin tools in registry after creation.
 
     Returns:
-        Tuple of (tool_function, max_retries, failure_signal, process_accumulated)
+        ToolEntry of (function, max_retries, failure_signal, process_accumulated)
     """
     entry = tools_registry.get(tool_name)
 
@@ -95,6 +111,6 @@ def get_tool_from_registry(
             tools_registry=tools_registry,
         )
         tools_registry[tool_name] = {"function": tool_function, "max_retries": DEFAULT_MAX_RETRIES}
-        return tool_function, DEFAULT_MAX_RETRIES, None, False
+        return ToolEntry(tool_function)
 
     raise ValueError(f"Tool '{tool_name}' not found in registry or builtins")
@@ -11,8 +11,7 @@ from ..lib.llm_resolver import resolve_llm_call
 from ..lib.signal_emission import emit_completion_signals, handle_llm_failure
 from ..lib.response_builder import (
     build_response_model,
-    extract_output_from_response,
-    extract_signals_from_response,
+    extract_output_and_signals,
 )
 from ...types import CallLlm, BroadcastSignalsCaller, Backends, LlmNodeCaller, EventTypes
 from ...lib.register_event import register_event
@@ -33,14 +32,16 @@ def create_llm_node_caller(
     """Create LLM node caller with pre-loaded dependencies."""
 
     def execute_llm_node(id: str, node_config: Dict[str, Any]) -> None:
-        validate_operational(id, backends)
+        context = validate_operational(id, backends)
         validate_node_config(node_config)
 
-        state = get_operational_state(id, node_config, backends)
+        state = get_operational_state(id, node_config, backends, context)
 
         register_event(backends, id, EventTypes.LLM_CALL, {"identity": state.identity})
 
-        rendered_prompt, warnings = render_prompt(state.prompt, state.context)
+        rendered_prompt, warnings = render_prompt(
+            state.prompt, state.context, state.prompt_warnings
+        )
 
         if warnings:
             register_event(backends, id, EventTypes.CONTEXT_WARNING, {"warnings": warnings})
@@ -55,8 +56,11 @@ def create_llm_node_caller(
             output_field=state.output_field,
             output_schema=state.output_model,
             signal_options=state.signal_options,
+            signal_key=state.signal_key,
         )
 
+        # Only the LLM call is guarded: a downstream node failing inside the
+        # completion broadcast is not a failure of this LLM call
         try:
             raw_response = resolve_llm_call(
                 call_llm=call_llm,
@@ -65,31 +69,6 @@ def create_llm_node_caller(
                 response_model=response_model,
                 max_retries=state.max_retries,
             )
-
-            output_value = extract_output_from_response(raw_response, state.output_field)
-            save_output_to_context(id, state.output_field, output_value, backends)
-
-            if state.output_field:
-                if state.output_field in state.context:
-                    state.context[state.output_field].append(output_value)
-                else:
-                    state.context[state.output_field] = [output_value]
-
-            save_conversation_turn(
-                state.history_key, state.conversation_history,
-                rendered_prompt, str(output_value), backends
-            )
-
-            selected_signals = extract_signals_from_response(raw_response)
-
-            emit_completion_signals(
-                selected_signals=selected_signals,
-                node_config=node_config,
-                operational_state=state,
-                broadcast_signals_caller=broadcast_signals_caller,
-                execution_id=id,
-            )
-
         except Exception as e:
             handle_llm_failure(
                 failure_signal=state.llm_failure_signal,
@@ -99,5 +78,28 @@ def create_llm_node_caller(
                 backends=backends,
                 broadcast_signals_caller=broadcast_signals_caller,
             )
+            return
+
+        output_value, selected_signals = extract_output_and_signals(
+            raw_response, state.output_field
+        )
+        # The LLM_CALL/CONTEXT_WARNING events above saved the context since
+        # it was loaded, so the save reloads it; conditions use the result
+        saved_context = save_output_to_context(id, state.output_field, output_value, backends)
+        if saved_context is not None:
+            state = state._replace(context=saved_context)
+
+        save_conversation_turn(
+            state.history_key, state.conversation_history,
+            rendered_prompt, output_value, backends
+        )
+
+        emit_completion_signals(
+            selected_signals=selected_signals,
+            node_config=node_config,
+            operational_state=state,
+            broadcast_signals_caller=broadcast_signals_caller,
+            execution_id=id,
+        )
 
     return execute_llm_node
@@ -1,17 +1,21 @@
 """LLM node state retrieval."""
 
-import json
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, ConfigDict
+from typing import Dict, Any, List, NamedTuple, Optional
 from ...types import Backends
 from ..lib.conversation_history import get_conversation_history, format_conversation_history
 from ...lib.jinja_render import get_context_for_prompt
+from ...lib.json_encode import dumps
 from ..lib.output import get_output_model, get_signal_options
+from ..lib.response_builder import SignalKey, get_signal_key
 
 
-class LlmOperationalState(BaseModel):
-    """All data needed for LLM node execution."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+class LlmOperationalState(NamedTuple):
+    """
+    All data needed for LLM node execution.
+
+    Built from already-trusted internal data on every LLM execution, so it
+    is a NamedTuple rather than a validated pydantic model.
+    """
 
     context: Dict[str, Any]
     main_execution_id: str
@@ -25,19 +29,23 @@ class LlmOperationalState(BaseModel):
     history_key: Optional[str]
     conversation_history: List[Dict[str, Any]]
     context_data: Dict[str, Any]
+    prompt_warnings: List[str]
     context_str: str
     history_str: str
     output_model: Optional[Any]
     signal_options: Optional[List[Dict[str, str]]]
+    signal_key: SignalKey
 
 
 def get_operational_state(
     execution_id: str,
     node_config: Dict[str, Any],
     backends: Backends,
+    context: Optional[Dict[str, Any]] = None,
 ) -> LlmOperationalState:
     """Retrieve all state needed for LLM node execution."""
-    context = backends.context.get_context(execution_id)
+    if context is None:
+        context = backends.context.get_context(execution_id)
     operational = context["__operational__"]
     identity = node_config.get("identity")
     prompt = node_config["prompt"]
@@ -46,15 +54,16 @@ def get_operational_state(
     current_workflow_name = backends.workflow.get_current_workflow_name(execution_id)
 
     history_key, conversation_history = get_conversation_history(
-        execution_id, identity, backends
+        execution_id, identity, backends, context
     )
 
-    context_data, _ = get_context_for_prompt(context, prompt)
-    context_str = json.dumps(context_data, indent=2) if context_data else ""
+    context_data, prompt_warnings = get_context_for_prompt(context, prompt)
+    context_str = dumps(context_data, indent=True) if context_data else ""
     history_str = format_conversation_history(conversation_history)
     main_execution_id = operational["main_execution_id"]
     output_model = get_output_model(backends, main_execution_id, output_field)
     signal_options = get_signal_options(event_emissions)
+    signal_key = get_signal_key(signal_options)
 
     return LlmOperationalState(
         context=context,
@@ -69,8 +78,10 @@ def get_operational_state(
         history_key=history_key,
         conversation_history=conversation_history,
         context_data=context_data,
+        prompt_warnings=prompt_warnings,
         context_str=context_str,
         history_str=history_str,
         output_model=output_model,
         signal_options=signal_options,
+        signal_key=signal_key,
     )
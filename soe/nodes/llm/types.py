@@ -2,11 +2,16 @@
 LLM node models and data structures
 """
 
-from pydantic import BaseModel
+from typing import NamedTuple
 
 
-class LlmNodeInput(BaseModel):
-    """Input model for LLM execution."""
+class LlmNodeInput(NamedTuple):
+    """
+    Input for LLM execution.
+
+    Built from already-rendered strings on every LLM execution, so it is a
+    NamedTuple rather than a validated pydantic model.
+    """
     prompt: str
     context: str = ""
     conversation_history: str = ""
@@ -1,17 +1,19 @@
 """
 LLM node configuration validation.
 
-Called once at orchestration start, not during node execution.
+Runs at orchestration start and again when the node executes; configs
+that already passed are remembered (see lib/config_cache.py).
 """
 
 from typing import Dict, Any
+from ....lib.config_cache import remember_valid_configs
 from ....types import WorkflowValidationError
 
 
+@remember_valid_configs
 def validate_node_config(node_config: Dict[str, Any]) -> None:
     """
     Validate LLM node configuration exhaustively.
-    Called once at orchestration start, not during node execution.
 
     Raises:
         WorkflowValidationError: If configuration is invalid
@@ -2,14 +2,17 @@
 Router node state retrieval.
 """
 
-from typing import Dict, Any, List
-from pydantic import BaseModel, ConfigDict
+from typing import Dict, Any, List, NamedTuple, Optional
 from ...types import Backends
 
 
-class RouterOperationalState(BaseModel):
-    """All data needed for router node execution."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+class RouterOperationalState(NamedTuple):
+    """
+    All data needed for router node execution.
+
+    Built from already-trusted internal data on every router execution, so
+    it is a NamedTuple rather than a validated pydantic model.
+    """
 
     context: Dict[str, Any]
     main_execution_id: str
@@ -20,9 +23,11 @@ def get_operational_state(
     execution_id: str,
     node_config: Dict[str, Any],
     backends: Backends,
+    context: Optional[Dict[str, Any]] = None,
 ) -> RouterOperationalState:
     """Retrieve all state needed for router node execution."""
-    context = backends.context.get_context(execution_id)
+    if context is None:
+        context = backends.context.get_context(execution_id)
     operational = context["__operational__"]
 
     return RouterOperationalState(
@@ -1,18 +1,20 @@
 """
 Router node configuration validation.
 
-Called once at orchestration start, not during node execution.
+Runs at orchestration start and again when the node executes; configs
+that already passed are remembered (see lib/config_cache.py).
 """
 
 from typing import Dict, Any
+from ....lib.config_cache import remember_valid_configs
 from ....types import WorkflowValidationError
 from ....validation.jinja import validate_jinja_syntax
 
 
+@remember_valid_configs
 def validate_node_config(node_config: Dict[str, Any]) -> None:
     """
     Validate router node configuration exhaustively.
-    Called once at orchestration start, not during node execution.
 
     Raises:
         WorkflowValidationError: If configuration is invalid
@@ -42,17 +44,20 @@ def validate_node_config(node_config: Dict[str, Any]) -> None:
             raise WorkflowValidationError(
                 f"Each event_emission must be an object with 'signal_name', got invalid item at position {i + 1}"
             )
-        if not emission.get("signal_name"):
+        signal_name = emission.get("signal_name")
+        condition = emission.get("condition")
+        if not signal_name:
             raise WorkflowValidationError(
                 f"Event emission at position {i + 1} is missing 'signal_name'"
             )
-        condition = emission.get("condition")
-        if condition is not None and not isinstance(condition, str):
+        if condition is None:
+            continue
+        if not isinstance(condition, str):
             raise WorkflowValidationError(
                 f"Event emission at position {i + 1} has invalid 'condition' - must be a jinja string"
             )
         if condition:
             validate_jinja_syntax(
                 condition,
-                f"Event emission '{emission.get('signal_name')}' condition"
+                f"Event emission '{signal_name}' condition"
             )
@@ -2,7 +2,7 @@
 Tool node factory
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 from .validation import validate_tool_node_config
 from .validation.operational import validate_tool_node_runtime
@@ -10,7 +10,7 @@ from .state import get_operational_state
 from .lib.failure import handle_tool_failure
 from .lib.conditions import evaluate_tool_conditions
 from .types import ToolsRegistry
-from ...lib.register_event import register_event
+from ...lib.register_event import event_timestamp, register_event, register_events
 from ..lib.context import save_output_to_context
 from ...types import Backends, BroadcastSignalsCaller, ToolNodeCaller, EventTypes
 
@@ -24,43 +24,58 @@ def create_tool_node_caller(
 
     def execute_tool_node(id: str, node_config: Dict[str, Any]) -> None:
         validate_tool_node_config(node_config, tools_registry)
-        validate_tool_node_runtime(id, backends)
+        context = validate_tool_node_runtime(id, backends)
 
-        state = get_operational_state(id, node_config, backends, tools_registry)
+        state = get_operational_state(id, node_config, backends, tools_registry, context)
 
         register_event(
             backends, id, EventTypes.TOOL_CALL,
             {"tool_name": state.tool_name, "max_retries": state.max_retries}
         )
 
-        last_error = None
-        for attempt in range(state.max_retries + 1):
+        tool_function = state.tool_function
+        parameters = state.parameters
+        max_retries = state.max_retries
+        pass_as_list = state.process_accumulated and isinstance(parameters, list)
+
+        # Retry errors are registered in one batch once the attempts settle.
+        # Only the tool call is retried; failures in saving the output or in
+        # downstream nodes triggered by the broadcast propagate as-is.
+        retry_events: List[Tuple[str, Dict[str, Any], str]] = []
+        for attempt in range(max_retries + 1):
             try:
-                if state.process_accumulated and isinstance(state.parameters, list):
-                    result = state.tool_function(state.parameters)
+                if pass_as_list:
+                    result = tool_function(parameters)
                 else:
-                    result = state.tool_function(**state.parameters)
-                save_output_to_context(id, state.output_field, result, backends)
-
-                signals = evaluate_tool_conditions(
-                    state.event_emissions, result, state.context, id, backends
+                    result = tool_function(**parameters)
+                break
+            except Exception as tool_error:
+                if attempt < max_retries:
+                    retry_events.append((
+                        EventTypes.NODE_ERROR,
+                        {"tool_name": state.tool_name, "retry_attempt": attempt + 1, "error": str(tool_error)},
+                        event_timestamp(),
+                    ))
+                    continue
+                register_events(backends, id, retry_events)
+                handle_tool_failure(
+                    state.tool_name, state.failure_signal, state.output_field,
+                    str(tool_error), backends, broadcast_signals_caller, id
                 )
-                if signals:
-                    broadcast_signals_caller(id, signals)
                 return
 
-            except Exception as tool_error:
-                last_error = tool_error
-                if attempt < state.max_retries:
-                    register_event(
-                        backends, id, EventTypes.NODE_ERROR,
-                        {"tool_name": state.tool_name, "retry_attempt": attempt + 1, "error": str(tool_error)}
-                    )
-                    continue
+        register_events(backends, id, retry_events)
+
+        # The tool may have written to the context itself, so the save
+        # reloads it; conditions then reuse the saved context
+        saved_context = save_output_to_context(id, state.output_field, result, backends)
+        if saved_context is None:
+            saved_context = state.context
 
-        handle_tool_failure(
-            state.tool_name, state.failure_signal, state.output_field,
-            str(last_error), backends, broadcast_signals_caller, id
+        signals = evaluate_tool_conditions(
+            state.event_emissions, result, saved_context, id, backends
         )
+        if signals:
+            broadcast_signals_caller(id, signals)
 
     return execute_tool_node
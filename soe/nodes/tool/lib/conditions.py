@@ -5,7 +5,8 @@ Tool-specific condition evaluation with error logging.
 from typing import Dict, List, Any
 
 from ...lib.conditions import evaluate_conditions
-from ....lib.context_fields import get_field
+from ...lib.signals import has_jinja_conditions
+from ....lib.context_fields import ContextView
 from ....lib.register_event import register_event
 from ....types import Backends, EventTypes
 
@@ -22,10 +23,10 @@ def evaluate_tool_conditions(
         return []
 
     try:
-        unwrapped = {k: get_field(context, k) for k in context if not k.startswith("__")}
-        for k, v in context.items():
-            if k.startswith("__"):
-                unwrapped[k] = v
+        if not has_jinja_conditions(event_emissions):
+            return [emission.get("signal_name") for emission in event_emissions]
+
+        unwrapped = ContextView(context)
         return evaluate_conditions(event_emissions, {"result": result, "context": unwrapped}, context)
     except Exception as e:
         register_event(
@@ -16,13 +16,24 @@ def handle_tool_failure(
     broadcast_signals_caller: BroadcastSignalsCaller,
     execution_id: str,
 ) -> None:
-    """Handle tool execution failure by saving error and optionally emitting failure signal."""
-    save_output_to_context(execution_id, output_field, error_message, backends)
+    """
+    Handle tool execution failure by saving error and optionally emitting failure signal.
+
+    The error output and the operational error count share one context
+    read and write.
+    """
+    context = backends.context.get_context(execution_id)
 
     register_event(
         backends, execution_id, EventTypes.NODE_ERROR,
-        {"tool_name": tool_name, "error": error_message}
+        {"tool_name": tool_name, "error": error_message},
+        context=context,
     )
 
+    if output_field:
+        save_output_to_context(execution_id, output_field, error_message, backends, context=context)
+    else:
+        backends.context.save_context(execution_id, context)
+
     if failure_signal:
         broadcast_signals_caller(execution_id, [failure_signal])
@@ -1,9 +1,11 @@
 """Tool parameter extraction and validation utilities."""
 
 import inspect
-from typing import Dict, Any, Callable, Optional
+from functools import lru_cache
+from typing import Dict, Any, Callable, FrozenSet, NamedTuple, Optional, Tuple
 
 from ....lib.context_fields import get_field
+from ...lib.tools import TOOL_INTROSPECTION_CACHE_SIZE
 from ..types import ToolParameterError
 
 
@@ -39,29 +41,54 @@ def extract_tool_parameters(
     return parameters
 
 
-def validate_tool_parameters(
-    tool_function: Callable, parameters: Dict[str, Any], tool_name: str
-) -> None:
-    """Validate parameters match tool function signature."""
+_EMPTY = inspect.Parameter.empty
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+
+
+class _ParameterSpec(NamedTuple):
+    required: Tuple[str, ...]  # signature order, for error messages
+    required_set: FrozenSet[str]
+    accepted: FrozenSet[str]
+    has_var_keyword: bool
+
+
+@lru_cache(maxsize=TOOL_INTROSPECTION_CACHE_SIZE)
+def _get_parameter_spec(tool_function: Callable) -> _ParameterSpec:
+    """Required and accepted parameter names of a tool, cached per function."""
     signature = inspect.signature(tool_function)
 
     has_var_keyword = any(
-        param.kind == inspect.Parameter.VAR_KEYWORD
+        param.kind is _VAR_KEYWORD
         for param in signature.parameters.values()
     )
 
+    required = []
     for param_name, param in signature.parameters.items():
-        if param.kind in (inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL):
+        if param.kind is _VAR_KEYWORD or param.kind is _VAR_POSITIONAL:
             continue
-        if param.default == inspect.Parameter.empty:
-            if param_name not in parameters:
-                raise ToolParameterError(
-                    f"Tool '{tool_name}' missing required parameter: {param_name}"
-                )
-
-    if not has_var_keyword:
-        for param_name in parameters.keys():
-            if param_name not in signature.parameters:
-                raise ToolParameterError(
-                    f"Tool '{tool_name}' unexpected parameter: {param_name}"
-                )
+        if param.default is _EMPTY:
+            required.append(param_name)
+
+    return _ParameterSpec(
+        tuple(required), frozenset(required), frozenset(signature.parameters), has_var_keyword
+    )
+
+
+def validate_tool_parameters(
+    tool_function: Callable, parameters: Dict[str, Any], tool_name: str
+) -> None:
+    """Validate parameters match tool function signature."""
+    spec = _get_parameter_spec(tool_function)
+
+    if not parameters.keys() >= spec.required_set:
+        missing = next(name for name in spec.required if name not in parameters)
+        raise ToolParameterError(
+            f"Tool '{tool_name}' missing required parameter: {missing}"
+        )
+
+    if not spec.has_var_keyword and not parameters.keys() <= spec.accepted:
+        unexpected = next(name for name in parameters if name not in spec.accepted)
+        raise ToolParameterError(
+            f"Tool '{tool_name}' unexpected parameter: {unexpected}"
+        )
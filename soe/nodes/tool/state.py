@@ -2,19 +2,30 @@
 Tool node state retrieval.
 """
 
-from typing import Callable, Dict, Any, List, Optional
-from pydantic import BaseModel, ConfigDict
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, NamedTuple, Optional
 
 from ...types import Backends
 from ...lib.yaml_parser import parse_yaml
 from ...lib.context_fields import get_field
+from ...lib.jinja_render import get_render_variables, render_prompt
+from ..lib.context import fast_clone
 from ..lib.tools import get_tool_from_registry
 from .types import ToolsRegistry
 
 
-class ToolOperationalState(BaseModel):
-    """All data needed for tool node execution."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+PARAMETER_YAML_CACHE_SIZE = 256
+# Longer strings are parsed every time rather than held in the cache
+MAX_CACHED_PARAMETER_YAML_LENGTH = 64 * 1024
+
+
+class ToolOperationalState(NamedTuple):
+    """
+    All data needed for tool node execution.
+
+    Built from already-trusted internal data on every tool execution, so
+    it is a NamedTuple rather than a validated pydantic model.
+    """
 
     context: Dict[str, Any]
     main_execution_id: str
@@ -33,9 +44,11 @@ def get_operational_state(
     node_config: Dict[str, Any],
     backends: Backends,
     tools_registry: ToolsRegistry,
+    context: Optional[Dict[str, Any]] = None,
 ) -> ToolOperationalState:
     """Retrieve all state needed for tool node execution."""
-    context = backends.context.get_context(execution_id)
+    if context is None:
+        context = backends.context.get_context(execution_id)
     operational = context["__operational__"]
     tool_name = node_config["tool_name"]
     tool_function, max_retries, failure_signal, process_accumulated = get_tool_from_registry(
@@ -48,13 +61,15 @@ def get_operational_state(
 
     if inline_parameters is not None:
         # Inline parameters from YAML - render any Jinja templates
-        parameters = _render_parameters(inline_parameters, context)
+        parameters = _render_parameters(
+            inline_parameters, context, get_render_variables(context)
+        )
     elif context_parameter_field and context_parameter_field in context:
         if process_accumulated:
             raw_params = context[context_parameter_field]
         else:
             raw_params = get_field(context, context_parameter_field)
-        parameters = parse_yaml(raw_params) if isinstance(raw_params, str) else raw_params
+        parameters = _parse_parameters(raw_params) if isinstance(raw_params, str) else raw_params
     else:
         parameters = {}
 
@@ -72,15 +87,66 @@ def get_operational_state(
     )
 
 
-def _render_parameters(params: Any, context: Dict[str, Any]) -> Any:
-    """Render Jinja templates in parameter values."""
-    from ...lib.jinja_render import render_prompt
+@lru_cache(maxsize=PARAMETER_YAML_CACHE_SIZE)
+def _parse_parameter_yaml(raw_params: str) -> Any:
+    return parse_yaml(raw_params)
 
-    if isinstance(params, dict):
-        return {k: _render_parameters(v, context) for k, v in params.items()}
-    elif isinstance(params, list):
-        return [_render_parameters(item, context) for item in params]
-    elif isinstance(params, str) and "{{" in params:
-        rendered, _ = render_prompt(params, context)
+
+def _parse_parameters(raw_params: str) -> Any:
+    """
+    Parse YAML tool parameters stored as a string in the context.
+
+    Agents tend to write the same parameter string repeatedly, so parsed
+    results are cached. Each caller gets its own copy, since tools may
+    mutate the values they are given.
+    """
+    if len(raw_params) > MAX_CACHED_PARAMETER_YAML_LENGTH:
+        return parse_yaml(raw_params)
+    return fast_clone(_parse_parameter_yaml(raw_params))
+
+
+def _render_parameters(
+    params: Any, context: Dict[str, Any], render_variables: Dict[str, Any]
+) -> Any:
+    """
+    Render Jinja templates in parameter values.
+
+    Containers are copied only when something inside them renders, so
+    static parameters come back as the same objects. Static leaves are
+    skipped in place rather than visited recursively.
+    """
+    if isinstance(params, str):
+        if "{{" not in params:
+            return params
+        # Warnings are discarded, so skip collecting them
+        rendered, _ = render_prompt(params, context, warnings=[], render_variables=render_variables)
         return rendered
+    if isinstance(params, dict):
+        rendered_dict = None
+        for key, value in params.items():
+            if isinstance(value, str):
+                if "{{" not in value:
+                    continue
+            elif not isinstance(value, (dict, list)):
+                continue
+            rendered = _render_parameters(value, context, render_variables)
+            if rendered is not value:
+                if rendered_dict is None:
+                    rendered_dict = dict(params)
+                rendered_dict[key] = rendered
+        return params if rendered_dict is None else rendered_dict
+    if isinstance(params, list):
+        rendered_list = None
+        for i, item in enumerate(params):
+            if isinstance(item, str):
+                if "{{" not in item:
+                    continue
+            elif not isinstance(item, (dict, list)):
+                continue
+            rendered = _render_parameters(item, context, render_variables)
+            if rendered is not item:
+                if rendered_list is None:
+                    rendered_list = list(params)
+                rendered_list[i] = rendered
+        return params if rendered_list is None else rendered_list
     return params
@@ -2,7 +2,7 @@
 Tool node models and exceptions
 """
 
-from typing import Callable, TypedDict, Union, Dict
+from typing import Callable, TypedDict, Union, Dict, Optional
 
 
 class ToolRegistryEntry(TypedDict, total=False):
@@ -10,6 +10,8 @@ class ToolRegistryEntry(TypedDict, total=False):
     function: Callable
     max_retries: int
     failure_signal: str
+    timeout: Optional[float]
+    cacheable: bool
 
 
 ToolsRegistry = Dict[str, Union[Callable, ToolRegistryEntry]]
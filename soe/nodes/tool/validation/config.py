@@ -1,11 +1,13 @@
 """
 Tool node configuration validation.
 
-Called once at orchestration start, not during node execution.
+Runs at orchestration start and again when the node executes; configs
+that already passed are remembered (see lib/config_cache.py).
 """
 
 from typing import Dict, Any, Callable, Union
 
+from ....lib.config_cache import remember_valid_configs
 from ....types import WorkflowValidationError
 from ....builtin_tools import get_builtin_tool_factory
 from ..types import ToolRegistryEntry, ToolsRegistry
@@ -50,6 +52,19 @@ def _validate_registry_entry(tool_name: str, entry: Union[Callable, ToolRegistry
                 f"Tool '{tool_name}' 'max_retries' must be a non-negative integer"
             )
 
+    timeout = entry.get("timeout")
+    if timeout is not None:
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0:
+            raise WorkflowValidationError(
+                f"Tool '{tool_name}' 'timeout' must be a positive number of seconds"
+            )
+
+    cacheable = entry.get("cacheable")
+    if cacheable is not None and not isinstance(cacheable, bool):
+        raise WorkflowValidationError(
+            f"Tool '{tool_name}' 'cacheable' must be a boolean"
+        )
+
     failure_signal = entry.get("failure_signal")
     if failure_signal is not None:
         if not isinstance(failure_signal, str):
@@ -58,10 +73,10 @@ def _validate_registry_entry(tool_name: str, entry: Union[Callable, ToolRegistry
             )
 
 
+@remember_valid_configs
 def validate_node_config(node_config: Dict[str, Any]) -> None:
     """
     Validate tool node configuration (structure only, no runtime checks).
-    Called once at orchestration start, not during node execution.
 
     Raises:
         WorkflowValidationError: If configuration is invalid
@@ -132,14 +147,15 @@ def validate_tool_node_config(
     validate_node_config(node_config)
 
     tool_name = node_config["tool_name"]
-    if tool_name not in tools_registry:
+    try:
+        entry = tools_registry[tool_name]
+    except KeyError:
         if not get_builtin_tool_factory(tool_name):
             raise WorkflowValidationError(
                 f"Tool '{tool_name}' not found in tools_registry or builtin tools"
-            )
+            ) from None
         return
 
-    entry = tools_registry[tool_name]
     _validate_registry_entry(tool_name, entry)
 
     tool_function = _get_function_from_entry(entry)
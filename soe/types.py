@@ -4,7 +4,7 @@ Types for orchestration system
 
 from __future__ import annotations
 
-from typing import Protocol, Optional, Any, Dict, List
+from typing import Protocol, Optional, Any, Dict, Iterable, List, Union
 
 
 class EventTypes:
@@ -22,13 +22,21 @@ class EventTypes:
     AGENT_TOOL_CALL = "agent_tool_call"
     AGENT_TOOL_RESULT = "agent_tool_result"
     AGENT_TOOL_NOT_FOUND = "agent_tool_not_found"
+    AGENT_TOOL_CACHE_HIT = "agent_tool_cache_hit"
     CONFIG_INHERITANCE_START = "config_inheritance_start"
     CONTEXT_INHERITANCE_START = "context_inheritance_start"
     CONTEXT_MERGE = "context_merge"
 
 
 class TelemetryBackend(Protocol):
-    """Protocol for telemetry backend"""
+    """
+    Protocol for telemetry backend
+
+    Backends may also implement the optional
+    log_events_batch(execution_id, events) to write several events at once,
+    each a dict with event_type plus the fields passed to log_event. Without
+    it, batched events are logged one at a time through log_event.
+    """
 
     def log_event(self, execution_id: str, event_type: str, **event_data) -> None:
         ...
@@ -116,14 +124,25 @@ class OrchestrateCaller(Protocol):
 
 
 class CallLlm(Protocol):
-    """Protocol for LLM caller function"""
+    """Protocol for LLM caller function
+
+    May return the full response text, or an iterable of text chunks for
+    streamed responses; a stream is read only until its JSON closes.
+    """
 
-    def __call__(self, prompt: str, config: Dict[str, Any]) -> str:
+    def __call__(self, prompt: str, config: Dict[str, Any]) -> Union[str, Iterable[str]]:
         ...
 
 
 class ConversationHistoryBackend(Protocol):
-    """Protocol for conversation history backend"""
+    """
+    Protocol for conversation history backend
+
+    Backends may also implement the optional
+    append_many_to_conversation_history(identity, entries) to append several
+    entries in one write. Without it, entries are appended one at a time
+    through append_to_conversation_history.
+    """
 
     def get_conversation_history(self, identity: str) -> List[Dict[str, Any]]:
         ...
@@ -16,6 +16,7 @@ from ..nodes.agent.validation import validate_node_config as validate_agent
 from ..nodes.llm.validation import validate_node_config as validate_llm
 from ..nodes.child.validation import validate_node_config as validate_child
 from ..nodes.tool.validation import validate_node_config as validate_tool
+from ..lib.config_cache import remember_valid_configs
 from ..lib.yaml_parser import parse_yaml
 
 
@@ -26,6 +27,7 @@ NODE_VALIDATORS = {
     "child": validate_child,
     "tool": validate_tool,
 }
+_VALID_NODE_TYPES = ", ".join(NODE_VALIDATORS)
 
 
 def _validate_workflow_section(workflow_name: str, workflow: Dict[str, Any]) -> None:
@@ -61,13 +63,13 @@ def _validate_workflow_section(workflow_name: str, workflow: Dict[str, Any]) ->
         if node_type.startswith("_"):
             continue
 
-        validator = NODE_VALIDATORS.get(node_type)
-        if not validator:
-            valid_types = ", ".join(NODE_VALIDATORS.keys())
+        try:
+            validator = NODE_VALIDATORS[node_type]
+        except KeyError:
             raise WorkflowValidationError(
                 f"Workflow '{workflow_name}', node '{node_name}': "
-                f"unknown node_type '{node_type}'. Valid types are: {valid_types}"
-            )
+                f"unknown node_type '{node_type}'. Valid types are: {_VALID_NODE_TYPES}"
+            ) from None
 
         try:
             validator(node_config)
@@ -122,25 +124,17 @@ def _validate_identities_section(identities: Dict[str, str]) -> None:
             )
 
 
-def validate_config(config) -> Dict[str, Any]:
+@remember_valid_configs
+def _validate_parsed_config(parsed: Dict[str, Any]) -> None:
     """
-    Parse and validate config.
+    Validate a parsed config in either format.
 
-    Supports two formats:
-    1. Legacy format: Dict of workflow definitions directly
-    2. Combined config format: Dict with 'workflows', 'context_schema', 'identities' keys
-
-    Args:
-        config: YAML string or dict (workflows only or combined config)
-
-    Returns:
-        Parsed config dict (either workflows directly or combined structure)
+    Each fan-out child orchestrates the same registry, so configs that
+    already passed are remembered (see lib/config_cache.py).
 
     Raises:
         WorkflowValidationError: If any configuration is invalid
     """
-    parsed = parse_yaml(config)
-
     if "workflows" in parsed:
         workflows = parsed["workflows"]
         if not isinstance(workflows, dict):
@@ -169,6 +163,26 @@ def validate_config(config) -> Dict[str, Any]:
                 )
             _validate_workflow_section(workflow_name, workflow)
 
+
+def validate_config(config) -> Dict[str, Any]:
+    """
+    Parse and validate config.
+
+    Supports two formats:
+    1. Legacy format: Dict of workflow definitions directly
+    2. Combined config format: Dict with 'workflows', 'context_schema', 'identities' keys
+
+    Args:
+        config: YAML string or dict (workflows only or combined config)
+
+    Returns:
+        Parsed config dict (either workflows directly or combined structure)
+
+    Raises:
+        WorkflowValidationError: If any configuration is invalid
+    """
+    parsed = parse_yaml(config)
+    _validate_parsed_config(parsed)
     return parsed
 
 
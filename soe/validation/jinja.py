@@ -13,6 +13,11 @@ def _dummy_accumulated_filter(value):
     return [value] if value is not None else []
 
 
+# Shared by every validation call
+_VALIDATION_ENV = Environment(loader=BaseLoader())
+_VALIDATION_ENV.filters["accumulated"] = _dummy_accumulated_filter
+
+
 def validate_jinja_syntax(template: str, context_description: str) -> None:
     """
     Validate Jinja template syntax at config time.
@@ -38,10 +43,9 @@ def validate_jinja_syntax(template: str, context_description: str) -> None:
     if not template or ("{{" not in template and "{%" not in template):
         return
     try:
-        env = Environment(loader=BaseLoader())
-        env.filters["accumulated"] = _dummy_accumulated_filter
-        env.parse(template)
-        env.from_string(template)
+        # Unknown filters are only reported at compile time; compiling the
+        # parsed AST avoids parsing the template a second time
+        _VALIDATION_ENV.compile(_VALIDATION_ENV.parse(template))
     except TemplateSyntaxError as e:
         raise WorkflowValidationError(
             f"{context_description}: Jinja syntax error - {e.message}"
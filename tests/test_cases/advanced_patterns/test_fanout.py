@@ -81,6 +81,124 @@ class TestFanOutFanIn:
         backends.cleanup_all()
 
 
+class TestFanOutConcurrency:
+    """Tests for running fan-out children concurrently."""
+
+    def test_max_concurrency_runs_children_at_once(self):
+        """
+        With max_concurrency, children run side by side: every worker waits
+        on a shared barrier, which only releases if all three are running.
+        Their context updates still all reach the parent.
+        """
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def process_item(item_name: str) -> dict:
+            barrier.wait()
+            return {"processed": f"done:{item_name}"}
+
+        workflow = """
+main_workflow:
+  SpawnWorkers:
+    node_type: child
+    event_triggers: [START]
+    child_workflow_name: worker_workflow
+    child_initial_signals: [START]
+    fan_out_field: items_to_process
+    child_input_field: current_item
+    max_concurrency: 3
+    context_updates_to_parent: [worker_result]
+
+worker_workflow:
+  ProcessItem:
+    node_type: tool
+    event_triggers: [START]
+    tool_name: process_item
+    context_parameter_field: current_item
+    output_field: worker_result
+"""
+
+        backends = create_test_backends("fan_out_concurrent")
+        nodes, broadcast = create_nodes(backends, tools_registry={"process_item": process_item})
+
+        execution_id = orchestrate(
+            config=workflow,
+            initial_workflow_name="main_workflow",
+            initial_signals=["START"],
+            initial_context={
+                "items_to_process": [
+                    {"item_name": "item1"},
+                    {"item_name": "item2"},
+                    {"item_name": "item3"}
+                ]
+            },
+            backends=backends,
+            broadcast_signals_caller=broadcast,
+        )
+
+        context = backends.context.get_context(execution_id)
+        processed = sorted(result["processed"] for result in context["worker_result"])
+        assert processed == ["done:item1", "done:item2", "done:item3"]
+
+        backends.cleanup_all()
+
+
+    def test_concurrent_children_see_caller_contextvars(self):
+        """Children run on worker threads still see the caller's contextvars."""
+        import contextvars
+
+        request_id = contextvars.ContextVar("request_id", default=None)
+
+        def process_item(item_name: str) -> dict:
+            return {"processed": f"{request_id.get()}:{item_name}"}
+
+        workflow = """
+main_workflow:
+  SpawnWorkers:
+    node_type: child
+    event_triggers: [START]
+    child_workflow_name: worker_workflow
+    child_initial_signals: [START]
+    fan_out_field: items_to_process
+    child_input_field: current_item
+    max_concurrency: 2
+    context_updates_to_parent: [worker_result]
+
+worker_workflow:
+  ProcessItem:
+    node_type: tool
+    event_triggers: [START]
+    tool_name: process_item
+    context_parameter_field: current_item
+    output_field: worker_result
+"""
+
+        backends = create_test_backends("fan_out_contextvars")
+        nodes, broadcast = create_nodes(backends, tools_registry={"process_item": process_item})
+
+        token = request_id.set("req-42")
+        try:
+            execution_id = orchestrate(
+                config=workflow,
+                initial_workflow_name="main_workflow",
+                initial_signals=["START"],
+                initial_context={
+                    "items_to_process": [{"item_name": "item1"}, {"item_name": "item2"}]
+                },
+                backends=backends,
+                broadcast_signals_caller=broadcast,
+            )
+        finally:
+            request_id.reset(token)
+
+        context = backends.context.get_context(execution_id)
+        processed = sorted(result["processed"] for result in context["worker_result"])
+        assert processed == ["req-42:item1", "req-42:item2"]
+
+        backends.cleanup_all()
+
+
 class TestJudgePattern:
     """Tests for the Judge pattern (LLM selection from accumulated results)."""
 
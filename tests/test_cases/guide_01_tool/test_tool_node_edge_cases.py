@@ -80,6 +80,19 @@ example_workflow:
         condition: "{{ result.nonexistent.deeply.nested }}"
 """
 
+workflow_tool_context_condition = """
+example_workflow:
+  ExecuteToolContextCondition:
+    node_type: tool
+    event_triggers: [START]
+    tool_name: my_tool
+    context_parameter_field: params
+    output_field: result
+    event_emissions:
+      - signal_name: PROCESSED
+        condition: "{{ context.result.processed == 'test' }}"
+"""
+
 # --- Tools ---
 
 def my_tool(name: str, count: int) -> dict:
@@ -187,6 +200,98 @@ def test_tool_exception_emits_failure():
 
     # Error message stored in output_field
     assert "Tool crashed!" in context["result"]
+    # Failure counted in operational state
+    assert context["__operational__"]["errors"] == 1
+
+    backends.cleanup_all()
+
+
+def test_tool_retry_errors_are_recorded():
+    """
+    Each failed attempt that is retried is recorded as a node error
+    before the tool eventually succeeds.
+    """
+    attempts = []
+
+    def flaky_tool(name: str, count: int) -> dict:
+        attempts.append(name)
+        if len(attempts) < 3:
+            raise RuntimeError(f"attempt {len(attempts)} failed")
+        return {"processed": name, "count": count}
+
+    backends = create_test_backends("tool_retry_errors")
+
+    tools_registry = {
+        "my_tool": {
+            "function": flaky_tool,
+            "max_retries": 2,
+        }
+    }
+
+    nodes, broadcast_signals_caller = create_tool_nodes(backends, tools_registry)
+
+    execution_id = orchestrate(
+        config=workflow_simple_tool,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={"params": {"name": "test", "count": 5}},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    signals = extract_signals(backends, execution_id)
+    retry_errors = [
+        event["context"] for event in backends.telemetry.get_events(execution_id)
+        if "retry_attempt" in event.get("context", {})
+    ]
+
+    assert "SUCCESS" in signals
+    assert [event["retry_attempt"] for event in retry_errors] == [1, 2]
+    assert retry_errors[0]["error"] == "attempt 1 failed"
+
+    backends.cleanup_all()
+
+
+def test_downstream_failure_does_not_retry_tool():
+    """
+    A node triggered by the tool's signal that fails does not make the
+    tool run again or emit its failure_signal.
+    """
+    workflow = workflow_simple_tool + """
+  Downstream:
+    node_type: tool
+    event_triggers: [SUCCESS]
+    tool_name: missing_tool
+"""
+    calls = []
+
+    def counting_tool(name: str, count: int) -> dict:
+        calls.append(name)
+        return {"processed": name, "count": count}
+
+    backends = create_test_backends("tool_downstream_failure")
+
+    tools_registry = {
+        "my_tool": {
+            "function": counting_tool,
+            "max_retries": 2,
+            "failure_signal": "FAILURE",
+        }
+    }
+
+    nodes, broadcast_signals_caller = create_tool_nodes(backends, tools_registry)
+
+    with pytest.raises(WorkflowValidationError):
+        orchestrate(
+            config=workflow,
+            initial_workflow_name="example_workflow",
+            initial_signals=["START"],
+            initial_context={"params": {"name": "test", "count": 5}},
+            backends=backends,
+            broadcast_signals_caller=broadcast_signals_caller,
+        )
+
+    assert calls == ["test"]
 
     backends.cleanup_all()
 
@@ -272,6 +377,63 @@ def test_tool_condition_evaluation_error():
 
 # --- Inline Parameters Tests ---
 
+def test_tool_condition_sees_saved_output():
+    """Conditions reading the output field through context see the new value."""
+    backends = create_test_backends("tool_context_condition")
+
+    tools_registry = {"my_tool": my_tool}
+
+    nodes, broadcast_signals_caller = create_tool_nodes(backends, tools_registry)
+
+    execution_id = orchestrate(
+        config=workflow_tool_context_condition,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={"params": {"name": "test", "count": 5}},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    signals = extract_signals(backends, execution_id)
+    assert "PROCESSED" in signals
+
+    backends.cleanup_all()
+
+
+def test_yaml_string_parameters_are_not_shared():
+    """
+    Parameters stored as a YAML string are parsed for each execution, and
+    a tool mutating them does not affect later executions.
+    """
+    received = []
+
+    def mutating_tool(name: str, count: int, tags: list) -> dict:
+        received.append(list(tags))
+        tags.append("mutated")
+        return {"processed": name, "count": count}
+
+    tools_registry = {"my_tool": mutating_tool}
+    raw_params = "name: test\ncount: 5\ntags: [a]"
+
+    for run in range(2):
+        backends = create_test_backends(f"tool_yaml_params_{run}")
+        nodes, broadcast_signals_caller = create_tool_nodes(backends, tools_registry)
+
+        execution_id = orchestrate(
+            config=workflow_simple_tool,
+            initial_workflow_name="example_workflow",
+            initial_signals=["START"],
+            initial_context={"params": raw_params},
+            backends=backends,
+            broadcast_signals_caller=broadcast_signals_caller,
+        )
+
+        assert "SUCCESS" in extract_signals(backends, execution_id)
+        backends.cleanup_all()
+
+    assert received == [["a"], ["a"]]
+
+
 def test_inline_parameters():
     """
     Tool nodes can specify parameters directly in YAML instead of from context.
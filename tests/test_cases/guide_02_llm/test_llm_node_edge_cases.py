@@ -10,7 +10,7 @@ This test suite covers edge cases and failure modes for LLM nodes:
 
 import os
 import pytest
-from soe import orchestrate
+from soe import orchestrate, setup_orchestration
 from tests.test_cases.lib import create_test_backends, create_llm_nodes, extract_signals, create_call_llm
 
 
@@ -267,6 +267,111 @@ def test_llm_failure_emits_signal():
     backends.cleanup_all()
 
 
+@pytest.mark.skipif(
+    os.environ.get("SOE_INTEGRATION") == "1",
+    reason="Uses a failing downstream tool"
+)
+def test_downstream_failure_is_not_reported_as_llm_failure():
+    """
+    A node triggered by the LLM node's completion signal that fails does
+    not make the LLM node emit its llm_failure_signal.
+    """
+    workflow = workflow_llm_failure_signal + """
+  Downstream:
+    node_type: llm
+    event_triggers: [DONE]
+    prompt: "Summarize the result"
+    output_field: summary
+    retries: 0
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        if "Summarize" in prompt:
+            return '{"wrong_field": "value"}'
+        return '{"result": "ok"}'
+
+    backends = create_test_backends("llm_downstream_failure")
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_llm_nodes(backends, call_llm)
+
+    with pytest.raises(RuntimeError):
+        orchestrate(
+            config=workflow,
+            initial_workflow_name="example_workflow",
+            initial_signals=["START"],
+            initial_context={},
+            backends=backends,
+            broadcast_signals_caller=broadcast_signals_caller,
+        )
+
+    backends.cleanup_all()
+
+
+@pytest.mark.skipif(
+    is_integration_mode(),
+    reason="Counts stubbed LLM calls"
+)
+def test_llm_calls_counted_with_local_storage(tmp_path):
+    """
+    The operational LLM call counter survives the node's output save on
+    file-backed storage, where each read returns a fresh copy.
+    """
+    workflow = """
+example_workflow:
+  Fetch:
+    node_type: tool
+    event_triggers: [START]
+    tool_name: fetch
+    output_field: fetched
+    event_emissions:
+      - signal_name: FETCHED
+  Summarize:
+    node_type: llm
+    event_triggers: [FETCHED]
+    prompt: "Summarize {{ context.fetched }} and {{ context.missing_var }}"
+    output_field: summary
+    event_emissions:
+      - signal_name: SUMMARIZED
+        condition: "{{ context.summary == 'ok' }}"
+  Review:
+    node_type: llm
+    event_triggers: [SUMMARIZED]
+    prompt: "Review {{ context.summary }}"
+    output_field: review
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        if "Review" in prompt:
+            return '{"review": "fine"}'
+        return '{"summary": "ok"}'
+
+    backends, broadcast_signals_caller = setup_orchestration(
+        call_llm=create_call_llm(stub=stub_llm),
+        tools_registry={"fetch": lambda: {"items": 3}},
+        use_local_storage=True,
+        storage_dir=str(tmp_path),
+    )
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    operational = context["__operational__"]
+
+    assert "SUMMARIZED" in operational["signals"]
+    assert context["review"] == ["fine"]
+    assert operational["llm_calls"] == 2
+    assert operational["tool_calls"] == 1
+
+    backends.cleanup_all()
+
+
 # --- Jinja Edge Cases ---
 
 # Context field is None
@@ -586,3 +691,94 @@ def test_condition_on_output_field():
     assert "FAILURE_SIGNAL" not in signals
 
     backends.cleanup_all()
+
+
+@pytest.mark.skipif(
+    os.environ.get("SOE_INTEGRATION") == "1",
+    reason="Uses a stub to check context bookkeeping"
+)
+def test_output_field_history_appended_once_per_call():
+    """
+    Writing to an existing output field appends exactly one history entry
+    per LLM call.
+    """
+    workflow = """
+example_workflow:
+  First:
+    node_type: llm
+    event_triggers: [START]
+    prompt: "Say something"
+    output_field: result
+    event_emissions:
+      - signal_name: NEXT
+  Second:
+    node_type: llm
+    event_triggers: [NEXT]
+    prompt: "Say something else"
+    output_field: result
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        return '{"result": "said"}'
+
+    backends = create_test_backends("llm_output_history")
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_llm_nodes(backends, call_llm)
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={"result": "initial"},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"] == ["initial", "said", "said"]
+
+    backends.cleanup_all()
+
+
+@pytest.mark.skipif(
+    os.environ.get("SOE_INTEGRATION") == "1",
+    reason="Uses a stub stream to check early termination"
+)
+def test_streamed_response_stops_after_json_closes():
+    """
+    A call_llm that yields chunks is read only until the JSON object closes;
+    thinking text before it is skipped and the rest of the stream is not read.
+    """
+    consumed = []
+
+    def streaming_llm(prompt: str, config: dict):
+        for chunk in ['<think>{"result": "draft"}</think>', '{"result": ', '"final"}', " trailing", " text"]:
+            consumed.append(chunk)
+            yield chunk
+
+    workflow = """
+example_workflow:
+  Streamer:
+    node_type: llm
+    event_triggers: [START]
+    prompt: "Answer"
+    output_field: result
+"""
+
+    backends = create_test_backends("llm_streamed_response")
+    nodes, broadcast_signals_caller = create_llm_nodes(backends, streaming_llm)
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "final"
+    assert consumed[-1] == '"final"}'
+
+    backends.cleanup_all()
@@ -304,3 +304,828 @@ def test_agent_condition_on_output_field():
     assert "FAILURE_SIGNAL" not in signals
 
     backends.cleanup_all()
+
+
+def test_parallel_tool_calls():
+    """
+    When the router names several tools in tool_names, they run concurrently.
+    The barrier only releases if both tools are executing at the same time.
+    """
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetch_weather() -> str:
+        """Fetch the weather."""
+        barrier.wait()
+        return "Weather: sunny"
+
+    def fetch_news() -> str:
+        """Fetch the news."""
+        barrier.wait()
+        return "News: quiet day"
+
+    workflow = """
+example_workflow:
+  ParallelAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Summarize weather and news"
+    tools: [fetch_weather, fetch_news]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router and "Weather: sunny" in prompt and "News: quiet day" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_names": ["fetch_weather", "fetch_news"]}'
+        if is_parameter:
+            return '{}'
+        return '{"result": "Sunny and quiet"}'
+
+    backends = create_test_backends("agent_parallel_tools")
+    tools = [
+        {"function": fetch_weather, "max_retries": 0},
+        {"function": fetch_news, "max_retries": 0},
+    ]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "Sunny and quiet"
+    assert context["__operational__"]["tool_calls"] == 2
+
+    backends.cleanup_all()
+
+
+def test_parallel_tool_calls_with_builtin():
+    """
+    Builtin tools named alongside registered tools run on the calling thread,
+    one at a time, while the registered tools run in the pool.
+    """
+    import threading
+
+    tool_threads = {}
+
+    def fetch_weather() -> str:
+        """Fetch the weather."""
+        tool_threads["fetch_weather"] = threading.current_thread()
+        return "Weather: sunny"
+
+    workflow = """
+example_workflow:
+  MixedAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Fetch the weather and note it"
+    tools: [fetch_weather, soe_update_context]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router and "Weather: sunny" in prompt and "updated" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_names": ["fetch_weather", "soe_update_context"]}'
+        if is_parameter and '"tool_name":"soe_update_context"' in prompt:
+            return '{"updates": {"note": "sunny"}}'
+        if is_parameter:
+            return '{}'
+        return '{"result": "Noted"}'
+
+    backends = create_test_backends("agent_parallel_builtin")
+    tools = [{"function": fetch_weather, "max_retries": 0}]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "Noted"
+    assert context["note"][-1] == "sunny"
+    assert tool_threads["fetch_weather"] is not threading.main_thread()
+
+    backends.cleanup_all()
+
+
+def test_tool_timeout_aborts_agent():
+    """
+    A tool that exceeds its registry 'timeout' is retried, and after the final
+    timeout the agent loop aborts instead of asking the router again.
+    """
+    import threading
+
+    release = threading.Event()
+    attempts = {"n": 0}
+    router_calls = {"n": 0}
+
+    def slow_tool() -> str:
+        """Hang until released."""
+        attempts["n"] += 1
+        release.wait(2)
+        return "too late"
+
+    workflow = """
+example_workflow:
+  SlowAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Call the slow tool"
+    tools: [slow_tool]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router:
+            router_calls["n"] += 1
+            # Bound the loop so a missing abort cannot hang the suite
+            if router_calls["n"] > 3:
+                return '{"action": "finish"}'
+            return '{"action": "call_tool", "tool_name": "slow_tool"}'
+        if is_parameter:
+            return '{}'
+        return '{"result": "unreachable"}'
+
+    backends = create_test_backends("agent_tool_timeout")
+    tools = [{"function": slow_tool, "max_retries": 1, "timeout": 0.05}]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    try:
+        with pytest.raises(RuntimeError) as excinfo:
+            orchestrate(
+                config=workflow,
+                initial_workflow_name="example_workflow",
+                initial_signals=["START"],
+                initial_context={},
+                backends=backends,
+                broadcast_signals_caller=broadcast_signals_caller,
+            )
+    finally:
+        release.set()
+
+    assert "aborted after a tool timed out" in str(excinfo.value)
+    assert "timed out" in str(excinfo.value)
+    assert attempts["n"] == 2
+    assert router_calls["n"] == 1
+
+    backends.cleanup_all()
+
+
+def test_timed_tool_sees_caller_contextvars():
+    """
+    Tools run under a timeout still see contextvars set by the host
+    application, such as tracing or request-scoped state.
+    """
+    import contextvars
+
+    request_id = contextvars.ContextVar("request_id", default=None)
+    seen = []
+
+    def lookup() -> str:
+        """Look something up."""
+        seen.append(request_id.get())
+        return "found"
+
+    workflow = """
+example_workflow:
+  LookupAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Look it up"
+    tools: [lookup]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        if is_router and "found" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_name": "lookup"}'
+        return '{"result": "found"}'
+
+    backends = create_test_backends("agent_tool_contextvars")
+    tools = [{"function": lookup, "timeout": 5}]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    token = request_id.set("req-42")
+    try:
+        orchestrate(
+            config=workflow,
+            initial_workflow_name="example_workflow",
+            initial_signals=["START"],
+            initial_context={},
+            backends=backends,
+            broadcast_signals_caller=broadcast_signals_caller,
+        )
+    finally:
+        request_id.reset(token)
+
+    assert seen == ["req-42"]
+
+    backends.cleanup_all()
+
+
+def test_parallel_tools_see_caller_contextvars():
+    """Tools called in parallel also see the host application's contextvars."""
+    import contextvars
+
+    request_id = contextvars.ContextVar("request_id", default=None)
+    seen = []
+
+    def fetch_weather() -> str:
+        """Fetch the weather."""
+        seen.append(request_id.get())
+        return "Weather: sunny"
+
+    def fetch_news() -> str:
+        """Fetch the news."""
+        seen.append(request_id.get())
+        return "News: quiet day"
+
+    workflow = """
+example_workflow:
+  ParallelAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Summarize weather and news"
+    tools: [fetch_weather, fetch_news]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        if is_router and "Weather: sunny" in prompt and "News: quiet day" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_names": ["fetch_weather", "fetch_news"]}'
+        return '{"result": "Sunny and quiet"}'
+
+    backends = create_test_backends("agent_parallel_contextvars")
+    tools = [
+        {"function": fetch_weather, "timeout": None},
+        {"function": fetch_news, "timeout": None},
+    ]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    token = request_id.set("req-42")
+    try:
+        orchestrate(
+            config=workflow,
+            initial_workflow_name="example_workflow",
+            initial_signals=["START"],
+            initial_context={},
+            backends=backends,
+            broadcast_signals_caller=broadcast_signals_caller,
+        )
+    finally:
+        request_id.reset(token)
+
+    assert seen == ["req-42", "req-42"]
+
+    backends.cleanup_all()
+
+
+def test_identical_stage_inputs_reuse_llm_result():
+    """
+    Within one agent execution, a stage input identical to an earlier one
+    reuses the earlier LLM result instead of calling the LLM again.
+    """
+    tool_calls = {"n": 0}
+    parameter_calls = {"n": 0}
+
+    def ping(host: str) -> str:
+        """Ping a host."""
+        tool_calls["n"] += 1
+        return "pong"
+
+    workflow = """
+example_workflow:
+  PingAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Ping twice"
+    tools: [ping]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router and "pong" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_names": ["ping", "ping"]}'
+        if is_parameter:
+            parameter_calls["n"] += 1
+            return '{"host": "example.com"}'
+        return '{"result": "Pinged"}'
+
+    backends = create_test_backends("agent_llm_memo")
+    tools = [{"function": ping, "max_retries": 0, "cacheable": False}]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "Pinged"
+    assert tool_calls["n"] == 2
+    assert parameter_calls["n"] == 1
+
+    backends.cleanup_all()
+
+
+def test_zero_argument_tool_skips_parameter_stage():
+    """
+    A tool without parameters is called directly; no parameter-stage LLM
+    call is made for it.
+    """
+    parameter_calls = {"n": 0}
+
+    def get_current_time() -> str:
+        """Get the current time."""
+        return "12:00"
+
+    workflow = """
+example_workflow:
+  ClockAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "What time is it?"
+    tools: [get_current_time]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router and "12:00" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_name": "get_current_time"}'
+        if is_parameter:
+            parameter_calls["n"] += 1
+            return '{}'
+        return '{"result": "It is 12:00"}'
+
+    backends = create_test_backends("agent_zero_arg_tool")
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, [{"function": get_current_time}])
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "It is 12:00"
+    assert parameter_calls["n"] == 0
+
+    backends.cleanup_all()
+
+
+def test_router_proposed_tool_args_skip_parameter_stage():
+    """
+    Valid arguments proposed by the router are used directly; invalid ones
+    fall back to the parameter stage.
+    """
+    parameter_calls = {"n": 0}
+    router_calls = {"n": 0}
+    pages = []
+
+    def fetch_page(page: int) -> str:
+        """Fetch a page of results."""
+        pages.append(page)
+        return f"page-{page}"
+
+    workflow = """
+example_workflow:
+  PagingAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Read two pages"
+    tools: [fetch_page]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router:
+            router_calls["n"] += 1
+            if router_calls["n"] == 1:
+                return '{"action": "call_tool", "tool_name": "fetch_page", "tool_args": {"page": 1}}'
+            if router_calls["n"] == 2:
+                return '{"action": "call_tool", "tool_name": "fetch_page", "tool_args": {"page": "two"}}'
+            return '{"action": "finish"}'
+        if is_parameter:
+            parameter_calls["n"] += 1
+            return '{"page": 2}'
+        return '{"result": "Read"}'
+
+    backends = create_test_backends("agent_router_tool_args")
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, [{"function": fetch_page}])
+
+    orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    assert pages == [1, 2]
+    assert parameter_calls["n"] == 1
+
+    backends.cleanup_all()
+
+
+def test_repeated_tool_call_reuses_cached_result():
+    """
+    Calling a tool again with the same arguments in one agent execution
+    reuses the earlier result and records a cache-hit event instead.
+    """
+    tool_calls = {"n": 0}
+    router_calls = {"n": 0}
+
+    def lookup(key: str) -> str:
+        """Look up a value."""
+        tool_calls["n"] += 1
+        return f"value-of-{key}"
+
+    workflow = """
+example_workflow:
+  LookupAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Look up the key twice"
+    tools: [lookup]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router:
+            router_calls["n"] += 1
+            if router_calls["n"] > 2:
+                return '{"action": "finish"}'
+            return '{"action": "call_tool", "tool_name": "lookup"}'
+        if is_parameter:
+            return '{"key": "a"}'
+        return '{"result": "Looked up"}'
+
+    backends = create_test_backends("agent_tool_cache")
+    tools = [{"function": lookup, "max_retries": 0}]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    assert tool_calls["n"] == 1
+    assert router_calls["n"] == 3
+    event_types = [e["event_type"] for e in backends.telemetry.get_events(execution_id)]
+    assert event_types.count("agent_tool_cache_hit") == 1
+
+    backends.cleanup_all()
+
+
+def test_context_window_limits_history_in_prompt():
+    """
+    Only the last `context_window` history entries reach the LLM; older ones
+    are summarized by an omitted-entries note, and long tool results are cut.
+    """
+    router_prompts = []
+
+    def fetch_page(page: int) -> str:
+        """Fetch a page of results."""
+        return f"page-{page}:" + "x" * 3000
+
+    workflow = """
+example_workflow:
+  PagingAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Read three pages"
+    tools: [fetch_page]
+    context_window: 2
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router:
+            router_prompts.append(prompt)
+            if len(router_prompts) > 3:
+                return '{"action": "finish"}'
+            return '{"action": "call_tool", "tool_name": "fetch_page"}'
+        if is_parameter:
+            return f'{{"page": {len(router_prompts)}}}'
+        return '{"result": "Done"}'
+
+    backends = create_test_backends("agent_context_window")
+    tools = [{"function": fetch_page, "max_retries": 0}]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    last_router_prompt = router_prompts[-1]
+    assert "[1 earlier entries omitted]" in last_router_prompt
+    assert "page-1:" not in last_router_prompt
+    assert "page-2:" in last_router_prompt and "page-3:" in last_router_prompt
+    assert "...[truncated]" in last_router_prompt
+    assert "x" * 2001 not in last_router_prompt
+
+    backends.cleanup_all()
+
+
+def test_router_rejects_unknown_tool_name_during_validation():
+    """
+    The router schema only allows the agent's tool names, so an unknown name
+    is corrected by an LLM validation retry instead of a tool-not-found turn.
+    """
+    router_calls = {"n": 0}
+
+    def ping() -> str:
+        """Ping the service."""
+        return "pong"
+
+    workflow = """
+example_workflow:
+  StrictAgent:
+    node_type: agent
+    event_triggers: [START]
+    prompt: "Ping once"
+    tools: [ping]
+    output_field: result
+    event_emissions:
+      - signal_name: DONE
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        is_parameter = '"tool_name":' in prompt and not is_router
+
+        if is_router:
+            router_calls["n"] += 1
+            if "pong" in prompt:
+                return '{"action": "finish"}'
+            if "Validation failed" in prompt:
+                return '{"action": "call_tool", "tool_name": "ping"}'
+            return '{"action": "call_tool", "tool_name": "pinger"}'
+        if is_parameter:
+            return '{}'
+        return '{"result": "Pinged"}'
+
+    backends = create_test_backends("agent_router_tool_enum")
+    tools = [{"function": ping, "max_retries": 0}]
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, tools)
+
+    execution_id = orchestrate(
+        config=workflow,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "Pinged"
+    assert router_calls["n"] == 3
+
+    event_types = [e["event_type"] for e in backends.telemetry.get_events(execution_id)]
+    assert "agent_tool_not_found" not in event_types
+
+    backends.cleanup_all()
+
+
+class _MinimalTelemetry:
+    """Telemetry backend implementing only the required log_event."""
+
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, execution_id: str, event_type: str, **event_data) -> None:
+        self.events.append(event_type)
+
+
+def test_telemetry_backend_without_batch_method():
+    """
+    A telemetry backend that only implements log_event still works;
+    batched events are logged one at a time.
+    """
+    def get_current_time() -> str:
+        """Get the current time."""
+        return "12:00"
+
+    config = """
+workflows:
+  example_workflow:
+    ClockAgent:
+      node_type: agent
+      event_triggers: [START]
+      prompt: "What time is it?"
+      tools: [get_current_time]
+      output_field: result
+      event_emissions:
+        - signal_name: DONE
+identities:
+  assistant: "You are a helpful assistant."
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        if is_router and "12:00" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_name": "get_current_time"}'
+        return '{"result": "It is 12:00"}'
+
+    backends = create_test_backends("agent_minimal_telemetry")
+    telemetry = _MinimalTelemetry()
+    backends.telemetry = telemetry
+
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, [{"function": get_current_time}])
+
+    execution_id = orchestrate(
+        config=config,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "It is 12:00"
+    assert "agent_tool_call" in telemetry.events
+
+    backends.telemetry = None
+    backends.cleanup_all()
+
+
+class _MinimalConversationHistory:
+    """Conversation history backend without append_many_to_conversation_history."""
+
+    def __init__(self):
+        self.histories = {}
+
+    def get_conversation_history(self, identity: str):
+        return list(self.histories.get(identity, []))
+
+    def append_to_conversation_history(self, identity: str, entry) -> None:
+        self.histories.setdefault(identity, []).append(entry)
+
+    def save_conversation_history(self, identity: str, history) -> None:
+        self.histories[identity] = list(history)
+
+    def delete_conversation_history(self, identity: str) -> None:
+        self.histories.pop(identity, None)
+
+
+def test_conversation_history_backend_without_batch_method():
+    """
+    A conversation history backend without append_many_to_conversation_history
+    still records an agent's history; entries are appended one at a time.
+    """
+    def get_current_time() -> str:
+        """Get the current time."""
+        return "12:00"
+
+    config = """
+workflows:
+  example_workflow:
+    ClockAgent:
+      node_type: agent
+      event_triggers: [START]
+      prompt: "What time is it?"
+      tools: [get_current_time]
+      identity: assistant
+      output_field: result
+      event_emissions:
+        - signal_name: DONE
+identities:
+  assistant: "You are a helpful assistant."
+"""
+
+    def stub_llm(prompt: str, config: dict) -> str:
+        is_router = '"available_tools":' in prompt
+        if is_router and "12:00" in prompt:
+            return '{"action": "finish"}'
+        if is_router:
+            return '{"action": "call_tool", "tool_name": "get_current_time"}'
+        return '{"result": "It is 12:00"}'
+
+    backends = create_test_backends("agent_minimal_history")
+    conversation_history = _MinimalConversationHistory()
+    backends.conversation_history = conversation_history
+
+    call_llm = create_call_llm(stub=stub_llm)
+    nodes, broadcast_signals_caller = create_agent_nodes(backends, call_llm, [{"function": get_current_time}])
+
+    execution_id = orchestrate(
+        config=config,
+        initial_workflow_name="example_workflow",
+        initial_signals=["START"],
+        initial_context={},
+        backends=backends,
+        broadcast_signals_caller=broadcast_signals_caller,
+    )
+
+    context = backends.context.get_context(execution_id)
+    assert context["result"][-1] == "It is 12:00"
+    assert any(
+        "12:00" in str(entry.get("content"))
+        for history in conversation_history.histories.values()
+        for entry in history
+    )
+
+    backends.conversation_history = None
+    backends.cleanup_all()
@@ -8,6 +8,7 @@ This test suite covers edge cases and failure modes for identity:
 - Identity switching mid-workflow
 - Parallel LLM calls with same identity
 - Very long identity strings
+- Structured outputs saved to history
 """
 
 import json
@@ -23,6 +24,7 @@ from tests.test_cases.workflows.guide_identity import (
     IDENTITY_SWITCH_MID_WORKFLOW,
     PARALLEL_SAME_IDENTITY,
     LONG_IDENTITY,
+    MULTI_TURN_SAME_IDENTITY,
 )
 
 
@@ -436,3 +438,33 @@ identities:
         assert "creative writer" in identities["creative"]
 
         backends.cleanup_all()
+
+
+class TestStructuredOutputHistory:
+    """Structured LLM outputs are saved to conversation history as JSON."""
+
+    def test_dict_output_saved_as_json(self):
+        def stub_llm(prompt: str, config: Dict[str, Any]) -> str:
+            if "Continue the conversation" in prompt:
+                return json.dumps({"secondResponse": "Done"})
+            return json.dumps({"firstResponse": {"summary": "Café", "score": 3}})
+
+        backends = create_test_backends("identity_structured_history")
+        call_llm = create_call_llm(stub=stub_llm)
+        nodes, broadcast_signals_caller = create_nodes(backends, call_llm=call_llm)
+
+        execution_id = orchestrate(
+            config=MULTI_TURN_SAME_IDENTITY,
+            initial_workflow_name="example_workflow",
+            initial_signals=["START"],
+            initial_context={"topic": "coffee", "follow_up": "More"},
+            backends=backends,
+            broadcast_signals_caller=broadcast_signals_caller,
+        )
+
+        history = backends.conversation_history.get_conversation_history(execution_id)
+        assistant_turns = [entry["content"] for entry in history if entry["role"] == "assistant"]
+        assert json.loads(assistant_turns[0]) == {"summary": "Café", "score": 3}
+        assert assistant_turns[1] == "Done"
+
+        backends.cleanup_all()
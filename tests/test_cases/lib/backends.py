@@ -44,6 +44,11 @@ class VerboseTelemetryWrapper:
         print(f"\n[TELEMETRY] {event_type}: {event_data}")
         return self._backend.log_event(execution_id, event_type, **event_data)
 
+    def log_events_batch(self, execution_id: str, events):
+        for event in events:
+            print(f"\n[TELEMETRY] {event['event_type']}: {event}")
+        return self._backend.log_events_batch(execution_id, events)
+
     def get_events(self, execution_id: str):
         return self._backend.get_events(execution_id)
 
@@ -66,6 +71,10 @@ class VerboseConversationHistoryWrapper:
         print(f"\n[CONVERSATION APPEND] {identity}: {entry}")
         return self._backend.append_to_conversation_history(identity, entry)
 
+    def append_many_to_conversation_history(self, identity: str, entries):
+        print(f"\n[CONVERSATION APPEND MANY] {identity}: {entries}")
+        return self._backend.append_many_to_conversation_history(identity, entries)
+
     def save_conversation_history(self, identity: str, history):
         print(f"\n[CONVERSATION SAVE] {identity}: {history}")
         return self._backend.save_conversation_history(identity, history)
@@ -79,7 +79,7 @@ def create_nodes(
     Args:
         backends: LocalBackends instance
         call_llm: Optional LLM caller function
-        tools_registry: Optional dict mapping tool name -> callable
+        tools_registry: Optional dict mapping tool name -> callable or full config dict
 
     Returns:
         Tuple of (nodes dict, broadcast_signals_caller function)
@@ -97,7 +97,10 @@ def create_nodes(
         nodes["llm"] = create_llm_node_caller(backends, call_llm, broadcast_signals_caller)
         tools_list = []
         if tools_registry:
-            tools_list = [{"function": func, "max_retries": 0} for func in tools_registry.values()]
+            tools_list = [
+                entry if isinstance(entry, dict) else {"function": entry, "max_retries": 0}
+                for entry in tools_registry.values()
+            ]
         nodes["agent"] = create_agent_node_caller(backends, tools_list, call_llm, broadcast_signals_caller)
 
     # Tool if tools_registry provided (even if empty, to test validation)
@@ -155,8 +158,7 @@ def create_agent_nodes(
     tools_registry = {}
     if tools:
         for tool_config in tools:
-            func = tool_config["function"]
-            tools_registry[func.__name__] = func
+            tools_registry[tool_config["function"].__name__] = tool_config
     return create_nodes(backends, call_llm=call_llm, tools_registry=tools_registry)
 
 
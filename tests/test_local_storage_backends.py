@@ -1,3 +1,4 @@
+import json
 import pytest
 import os
 from soe.local_backends import create_local_backends, create_in_memory_backends
@@ -201,6 +202,79 @@ class TestLocalStorageBackends:
         events = backends.telemetry.get_events(execution_id)
         assert len(events) == 0
 
+    def test_telemetry_log_events_batch(self, backends):
+        """Test logging several telemetry events in one batch."""
+        execution_id = "telemetry_batch"
+        backends.telemetry.log_event(execution_id, "first", info="single")
+        backends.telemetry.log_events_batch(execution_id, [
+            {"event_type": "second", "info": "a"},
+            {"event_type": "third", "info": "b"},
+        ])
+
+        events = backends.telemetry.get_events(execution_id)
+        assert [e["event_type"] for e in events] == ["first", "second", "third"]
+        assert events[2]["info"] == "b"
+
+    def test_telemetry_event_types_interned(self, backends, tmp_path):
+        """Test event types are written once per file and restored on read."""
+        execution_id = "telemetry_interned"
+        for i in range(3):
+            backends.telemetry.log_event(execution_id, "llm_call", attempt=i)
+        backends.telemetry.log_event(execution_id, "tool_call", attempt=3)
+
+        raw = (tmp_path / "telemetry" / f"{execution_id}.jsonl").read_text()
+        assert raw.count('"llm_call"') == 1
+        assert raw.count('"tool_call"') == 1
+
+        events = backends.telemetry.get_events(execution_id)
+        assert [e["event_type"] for e in events] == ["llm_call"] * 3 + ["tool_call"]
+        assert [e["attempt"] for e in events] == [0, 1, 2, 3]
+
+    def test_telemetry_reads_legacy_and_reopened_files(self, backends, tmp_path):
+        """Test plain event lines and a fresh backend on an existing file."""
+        from soe.local_backends import LocalTelemetryBackend
+
+        execution_id = "telemetry_legacy"
+        telemetry_file = tmp_path / "telemetry" / f"{execution_id}.jsonl"
+        telemetry_file.write_text('{"event_type": "legacy_event", "info": "old"}\n')
+
+        backends.telemetry.log_event(execution_id, "new_event", info="new")
+        reopened = LocalTelemetryBackend(str(tmp_path / "telemetry"))
+        reopened.log_event(execution_id, "new_event", info="again")
+
+        events = reopened.get_events(execution_id)
+        assert [e["event_type"] for e in events] == ["legacy_event", "new_event", "new_event"]
+        assert telemetry_file.read_text().count('"new_event"') == 1
+
+    def test_telemetry_multiple_writers_and_external_delete(self, backends, tmp_path):
+        """Test type ids stay correct across writers and after the file is removed."""
+        from soe.local_backends import LocalTelemetryBackend
+
+        execution_id = "telemetry_writers"
+        telemetry_file = tmp_path / "telemetry" / f"{execution_id}.jsonl"
+        other = LocalTelemetryBackend(str(tmp_path / "telemetry"))
+
+        backends.telemetry.log_event(execution_id, "shared")
+        other.log_event(execution_id, "llm_call")
+        backends.telemetry.log_event(execution_id, "tool_call")
+        other.log_event(execution_id, "llm_call")
+
+        events = backends.telemetry.get_events(execution_id)
+        assert [e["event_type"] for e in events] == ["shared", "llm_call", "tool_call", "llm_call"]
+
+        telemetry_file.unlink()
+        backends.telemetry.log_event(execution_id, "tool_call")
+        assert [e["event_type"] for e in backends.telemetry.get_events(execution_id)] == ["tool_call"]
+
+    def test_telemetry_skips_unknown_type_ids(self, backends, tmp_path):
+        """Test frames pointing outside the type table are skipped."""
+        execution_id = "telemetry_unknown_type"
+        telemetry_file = tmp_path / "telemetry" / f"{execution_id}.jsonl"
+        telemetry_file.write_text('{"types": ["known"]}\n[0, {}]\n[5, {}]\n')
+
+        events = backends.telemetry.get_events(execution_id)
+        assert [e["event_type"] for e in events] == ["known"]
+
     def test_conversation_history_multiple_messages(self, backends):
         """Test appending multiple messages to conversation history."""
         identity = "multi_msg_test"
@@ -219,6 +293,92 @@ class TestLocalStorageBackends:
         assert history[0]["role"] == "user"
         assert history[1]["role"] == "assistant"
 
+    def test_conversation_history_append_many(self, backends):
+        """Test appending several messages with one call."""
+        identity = "append_many_test"
+        backends.conversation_history.append_to_conversation_history(
+            identity, {"role": "user", "content": "Hello"}
+        )
+        backends.conversation_history.append_many_to_conversation_history(identity, [
+            {"role": "tool", "content": "a"},
+            {"role": "tool", "content": "b"},
+        ])
+
+        history = backends.conversation_history.get_conversation_history(identity)
+        assert [entry["content"] for entry in history] == ["Hello", "a", "b"]
+
+
+class TestAsyncLocalStorageBackends:
+    """
+    Tests for local backends with background writes enabled.
+    """
+
+    @pytest.fixture
+    def backends(self, tmp_path):
+        """Create local backends that persist from a background thread"""
+        return create_local_backends(
+            context_storage_dir=str(tmp_path / "contexts"),
+            workflow_storage_dir=str(tmp_path / "workflows"),
+            conversation_history_storage_dir=str(tmp_path / "conversations"),
+            context_schema_storage_dir=str(tmp_path / "schemas"),
+            identity_storage_dir=str(tmp_path / "identities"),
+            async_writes=True,
+        )
+
+    def test_context_read_your_writes(self, backends, tmp_path):
+        """Test reads see the latest save before and after flush."""
+        execution_id = "async_ctx"
+        backends.context.save_context(execution_id, {"a": [1]})
+        backends.context.save_context(execution_id, {"a": [1, 2]})
+
+        loaded = backends.context.get_context(execution_id)
+        assert loaded == {"a": [1, 2]}
+
+        # Returned context is a fresh copy, not the cached object
+        loaded["a"].append(3)
+        assert backends.context.get_context(execution_id) == {"a": [1, 2]}
+
+        backends.context.flush()
+        context_file = tmp_path / "contexts" / f"{execution_id}.json"
+        assert json.loads(context_file.read_text()) == {"a": [1, 2]}
+
+    def test_conversation_history_persisted_after_flush(self, backends, tmp_path):
+        """Test conversation history appends are written in the background."""
+        identity = "async_history"
+        backends.conversation_history.append_to_conversation_history(
+            identity, {"role": "user", "content": "Hello"}
+        )
+        backends.conversation_history.append_to_conversation_history(
+            identity, {"role": "assistant", "content": "Hi"}
+        )
+        assert len(backends.conversation_history.get_conversation_history(identity)) == 2
+
+        backends.conversation_history.flush()
+        history_file = tmp_path / "conversations" / f"{identity}.json"
+        assert len(json.loads(history_file.read_text())) == 2
+
+        backends.conversation_history.delete_conversation_history(identity)
+        assert backends.conversation_history.get_conversation_history(identity) == []
+
+    def test_cleanup_waits_for_pending_writes(self, backends, tmp_path):
+        """Test cleanup_all removes files that were still queued."""
+        backends.context.save_context("pending", {"a": [1]})
+        backends.cleanup_all()
+
+        assert not (tmp_path / "contexts" / "pending.json").exists()
+        assert backends.context.get_context("pending") == {}
+
+    def test_writer_is_shared_and_releases_persisted_contents(self, backends, tmp_path):
+        """Test backends share one writer that drops contents once written."""
+        writer = backends.context._writer
+        assert writer is backends.conversation_history._writer
+
+        backends.context.save_context("released", {"a": [1]})
+        backends.context.flush()
+
+        assert writer.pending(tmp_path / "contexts" / "released.json") is None
+        assert backends.context.get_context("released") == {"a": [1]}
+
 
 class TestInMemoryBackends:
     """
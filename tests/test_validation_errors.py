@@ -298,6 +298,15 @@ class TestChildValidation:
                 "spawn_interval": -1
             })
 
+    def test_max_concurrency_not_positive(self):
+        with pytest.raises(WorkflowValidationError, match="'max_concurrency' must be a positive integer"):
+            validate_child({
+                "child_workflow_name": "sub",
+                "child_initial_signals": ["START"],
+                "event_triggers": ["RUN"],
+                "max_concurrency": 0
+            })
+
     def test_event_emissions_not_list(self):
         with pytest.raises(WorkflowValidationError, match="'event_emissions' must be a list"):
             validate_child({
@@ -430,6 +439,13 @@ class TestLlmValidation:
                 "identity": 123
             })
 
+    def test_invalid_config_fails_on_every_call(self):
+        """Only configs that pass are remembered by the validation cache."""
+        config = {"event_triggers": ["START"], "prompt": "Hello", "identity": 123}
+        for _ in range(2):
+            with pytest.raises(WorkflowValidationError, match="'identity' must be a string"):
+                validate_llm(config)
+
 
 class TestAgentValidation:
     """Agent node validation errors"""
@@ -486,6 +502,14 @@ class TestAgentValidation:
                 "retries": -1
             })
 
+    def test_context_window_not_positive(self):
+        with pytest.raises(WorkflowValidationError, match="'context_window' must be a positive integer"):
+            validate_agent({
+                "event_triggers": ["START"],
+                "prompt": "Do task",
+                "context_window": 0
+            })
+
     def test_event_emissions_not_list(self):
         with pytest.raises(WorkflowValidationError, match="'event_emissions' must be a list"):
             validate_agent({